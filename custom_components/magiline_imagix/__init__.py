@@ -2,29 +2,121 @@
 from __future__ import annotations
 
 import asyncio
+import copy
+import hashlib
 import logging
-from datetime import timedelta
+import pathlib
+import shutil
+import time
+from datetime import datetime, timedelta
+from functools import partial
+from collections import ChainMap
+from collections.abc import Collection, Hashable, Iterable, Sequence
 from typing import Any
 
 import aiohttp
 import async_timeout
+from aiohttp import hdrs
+from yarl import URL
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_HOST, Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.const import CONF_HOST, EVENT_HOMEASSISTANT_CLOSE, Platform
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.util import dt as dt_util
 from homeassistant.exceptions import ConfigEntryNotReady
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity,
     DataUpdateCoordinator,
     UpdateFailed,
 )
 
-from .const import DOMAIN, CONF_PATH, DEFAULT_PATH, CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
+from .const import (
+    DOMAIN,
+    CONF_PATH,
+    DEFAULT_PATH,
+    CONF_SCAN_INTERVAL,
+    DEFAULT_SCAN_INTERVAL,
+    CONF_ADAPTIVE_POLLING,
+    DEFAULT_ADAPTIVE_POLLING,
+    CONF_MAX_SCAN_INTERVAL,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    CONF_PUSH,
+    DEFAULT_PUSH,
+    PUSH_WATCHDOG_INTERVAL,
+    CONF_PUBLISH_WINDOW,
+    DEFAULT_PUBLISH_WINDOW,
+    BUFFER_CAPACITY,
+    STATISTIC_ATTRIBUTES,
+    FRESHNESS_WINDOW,
+    BREAKER_FAILURE_THRESHOLD,
+    BREAKER_PROBE_INTERVAL,
+    BREAKER_MAX_PROBE_INTERVAL,
+    STALE_INTERVALS,
+    CONF_CAPTURE,
+    DEFAULT_CAPTURE,
+    CAPTURE_MAX_BYTES,
+    CAPTURE_BACKUPS,
+    CONF_COMMAND_PATH,
+    DEFAULT_COMMAND_PATH,
+    CONF_ALARM_RULES,
+    DEFAULT_ALARM_RULES,
+    CONF_METRICS,
+    DEFAULT_METRICS,
+    CONF_SLOW_PATH,
+    DEFAULT_SLOW_PATH,
+    CONF_SLOW_SCAN_INTERVAL,
+    DEFAULT_SLOW_SCAN_INTERVAL,
+    CONF_CONNECT_TIMEOUT,
+    DEFAULT_CONNECT_TIMEOUT,
+    CONF_READ_TIMEOUT,
+    DEFAULT_READ_TIMEOUT,
+    ADAPTIVE_FAILURE_MAX_INTERVAL,
+    ADAPTIVE_FAST_INTERVAL,
+    MAX_PAYLOAD_SIZE,
+    STORAGE_VERSION,
+    STORAGE_SAVE_DELAY,
+    SENSOR_DEFINITIONS,
+    DERIVED_SENSOR_DEFINITIONS,
+    ALARM_RULES,
+    PoolSensorEntityDescription,
+)
+from .breaker import CircuitBreaker
+from .buffer import MetricPublisher
+from .capture import CaptureWriter
+from .decode import async_read_body, decode_payload
+from .derived import DerivedMetric
+from .endpoints import (
+    TIER_FAST,
+    TIER_SLOW,
+    Endpoint,
+    EndpointPayload,
+    build_endpoints,
+    merge_payloads,
+)
+from .hub import PoolHub, async_get_hub
+from .instrumentation import RefreshStats, RefreshTiming
+from .metrics import async_get_exporter
+from .normalize import CompiledSchema, CorruptPayload
+from .paths import CompiledPaths, PathKey, compile_sensor_paths, diff_snapshots
+from .push import async_setup_push
+from .rules import AlarmEngine, AlarmRule, parse_rules
+from .scheduler import AdaptiveScheduler
+from .templates import expand_sensor_descriptions, shape_signature, template_prefixes
+from .session import create_session
+from .writer import CommandWriter
 
 _LOGGER = logging.getLogger(__name__)
 
-PLATFORMS: list[Platform] = [Platform.SENSOR]
+PLATFORMS: list[Platform] = [
+    Platform.BINARY_SENSOR,
+    Platform.COVER,
+    Platform.NUMBER,
+    Platform.SELECT,
+    Platform.SENSOR,
+    Platform.SWITCH,
+]
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -34,23 +126,94 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     path = entry.options.get(CONF_PATH, entry.data.get(CONF_PATH, DEFAULT_PATH))
     scan_interval_seconds = entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
     
+    push = entry.options.get(CONF_PUSH, DEFAULT_PUSH)
+    if push:
+        # Pushed payloads keep the data fresh, polls only act as a watchdog
+        scan_interval_seconds = max(scan_interval_seconds, PUSH_WATCHDOG_INTERVAL)
+    
+    scheduler = None
+    if not push and entry.options.get(CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING):
+        scheduler = AdaptiveScheduler(
+            base=timedelta(seconds=scan_interval_seconds),
+            fast=timedelta(seconds=ADAPTIVE_FAST_INTERVAL),
+            ceiling=timedelta(
+                seconds=entry.options.get(
+                    CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL
+                )
+            ),
+            failure_ceiling=timedelta(seconds=ADAPTIVE_FAILURE_MAX_INTERVAL),
+        )
+    
     coordinator = PoolDataUpdateCoordinator(
         hass,
         entry,
         host=host,
         path=path,
+        slow_path=entry.options.get(CONF_SLOW_PATH, DEFAULT_SLOW_PATH) or path,
+        slow_interval=timedelta(
+            seconds=entry.options.get(
+                CONF_SLOW_SCAN_INTERVAL, DEFAULT_SLOW_SCAN_INTERVAL
+            )
+        ),
         scan_interval=timedelta(seconds=scan_interval_seconds),
+        scheduler=scheduler,
+        hub=async_get_hub(hass),
+        connect_timeout=entry.options.get(CONF_CONNECT_TIMEOUT, DEFAULT_CONNECT_TIMEOUT),
+        read_timeout=entry.options.get(CONF_READ_TIMEOUT, DEFAULT_READ_TIMEOUT),
+        capture=(
+            CaptureWriter(_capture_dir(hass, entry), CAPTURE_MAX_BYTES, CAPTURE_BACKUPS)
+            if entry.options.get(CONF_CAPTURE, DEFAULT_CAPTURE)
+            else None
+        ),
+        publish_window=entry.options.get(CONF_PUBLISH_WINDOW, DEFAULT_PUBLISH_WINDOW),
+        alarm_rules=parse_rules(entry.options.get(CONF_ALARM_RULES, DEFAULT_ALARM_RULES)),
     )
     
+    # Entries are not unloaded when Home Assistant stops
+    async def _async_close_session(event: Event) -> None:
+        await coordinator.session.close()
+
+    entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close_session)
+    )
+
+    # Control entities write through a debounced command queue
+    if command_path := entry.options.get(CONF_COMMAND_PATH, DEFAULT_COMMAND_PATH):
+        coordinator.writer = CommandWriter(hass, coordinator, command_path)
+        entry.async_on_unload(coordinator.writer.async_shutdown)
+
+    # Polls are scheduled by the hub shared by all pools
+    entry.async_on_unload(coordinator.hub.async_register(coordinator))
+
+    # Start from the last known state when there is one, so a slow or
+    # asleep controller does not hold up startup
+    hydrated = await coordinator.async_load_cache()
+
     # Fetch initial data
-    await coordinator.async_config_entry_first_refresh()
+    if not hydrated:
+        try:
+            await coordinator.async_config_entry_first_refresh()
+        except ConfigEntryNotReady:
+            await coordinator.session.close()
+            raise
 
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
+    if push:
+        entry.async_on_unload(async_setup_push(hass, entry, coordinator))
+
+    if entry.options.get(CONF_METRICS, DEFAULT_METRICS):
+        entry.async_on_unload(async_get_exporter(hass).async_register(coordinator))
+
     # Setup platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    if hydrated:
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN} first refresh"
+        )
+
     # Register update listener for options changes
     entry.async_on_unload(entry.add_update_listener(async_reload_entry))
 
@@ -62,16 +225,49 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        await coordinator.session.close()
 
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the cached state and the captures of a deleted config entry."""
+    await _cache_store(hass, entry).async_remove()
+    await hass.async_add_executor_job(
+        partial(shutil.rmtree, _capture_dir(hass, entry), ignore_errors=True)
+    )
+
+
+def _capture_dir(hass: HomeAssistant, entry: ConfigEntry) -> pathlib.Path:
+    """Return the directory of the capture log of a config entry."""
+    return pathlib.Path(hass.config.path(DOMAIN, "capture", entry.entry_id))
+
+
+def _compile_tier_paths(
+    descriptions: Iterable[PoolSensorEntityDescription],
+) -> dict[str, CompiledPaths]:
+    """Compile the paths of the sensors of each tier."""
+    tiers: dict[str, list[PoolSensorEntityDescription]] = {}
+    for description in descriptions:
+        tiers.setdefault(description.tier, []).append(description)
+    return {tier: compile_sensor_paths(group) for tier, group in tiers.items()}
+
+
+def _cache_store(hass: HomeAssistant, entry: ConfigEntry) -> Store[dict[str, Any]]:
+    """Return the store holding the last known payload of an entry."""
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}")
+
+
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Reload the config entry when options change."""
     await hass.config_entries.async_reload(entry.entry_id)
 
 
+class ControllerUnreachable(UpdateFailed):
+    """Error raised instead of a request while the circuit breaker is open."""
+
+
 class PoolDataUpdateCoordinator(DataUpdateCoordinator):
     """Class to manage fetching Pool data from the API."""
 
@@ -82,26 +278,368 @@ class PoolDataUpdateCoordinator(DataUpdateCoordinator):
         host: str,
         path: str,
         scan_interval: timedelta,
+        hub: PoolHub,
+        scheduler: AdaptiveScheduler | None = None,
+        connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+        read_timeout: float = DEFAULT_READ_TIMEOUT,
+        publish_window: float = DEFAULT_PUBLISH_WINDOW,
+        slow_path: str | None = None,
+        slow_interval: timedelta = timedelta(seconds=DEFAULT_SLOW_SCAN_INTERVAL),
+        capture: CaptureWriter | None = None,
+        alarm_rules: Iterable[AlarmRule] = (),
     ) -> None:
         """Initialize."""
         self.host = host
         self.path = path
-        self.session = async_get_clientsession(hass)
+        self.hub = hub
+        self.scheduler = scheduler
+        self.poll_interval = scan_interval
+        self.connect_timeout = connect_timeout
+        self.timeout = connect_timeout + read_timeout
+        self.session = create_session(connect_timeout, read_timeout)
+
+        # Device info shared by all entities of the pool
+        self.device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry.entry_id)},
+            name="Pool Monitor",
+            manufacturer="Pool Controller",
+            model="API Integration",
+        )
+
+        # Sensor descriptions expanded for the instances found in the
+        # payload, re-expanded only when its shape signature changes
+        self._template_prefixes = template_prefixes(SENSOR_DEFINITIONS)
+        self.shape: tuple[int, ...] | None = None
+        self.descriptions: list[PoolSensorEntityDescription] = []
+
+        # Sensor paths are compiled once per shape, values resolved once
+        # per refresh
+        self.paths = _compile_tier_paths(self.descriptions)
+        self.snapshot: dict[Hashable, Any] = {}
+
+        # Values are coerced and bounds checked once per payload
+        self.schema = CompiledSchema(self.descriptions)
+        self.schema_violations = 0
+        self.dropped_frames = 0
+
+        # Buffered measurements by sensor key, only when a window is set
+        self.publish_window = publish_window
+        self.publishers: dict[str, MetricPublisher] = {}
+        # Last measured values before publishing, sampled again when a poll
+        # brings no change and followed by the derived sensors and alarms
+        self._measurements: dict[Hashable, Any] = {}
+
+        # Running state of the derived sensors, persisted with the payload
+        self.derived: dict[str, DerivedMetric] = {
+            description.key: description.metric()
+            for description in DERIVED_SENSOR_DEFINITIONS
+        }
+
+        # Alarm rules evaluated in one pass per refresh, over the sensor
+        # and derived values
+        self.alarms = AlarmEngine((*ALARM_RULES, *alarm_rules))
+
+        # Bumped whenever the snapshot or the staleness changes, entities
+        # cache what they derive from the snapshot per generation
+        self.generation = 0
+
+        # Keys of the sensors whose value or attributes changed in the
+        # last refresh, only those entities write their state
+        self.changed_sensors: set[str] = set()
+        self.state_writes = 0
+        self.skipped_writes = 0
+
+        # Endpoints serving the tiers of sensors, each with the change
+        # detection of its raw payload, a hit reuses the parsed data
+        self.endpoints = build_endpoints(
+            {
+                TIER_FAST: (path, 0),
+                TIER_SLOW: (slow_path or path, slow_interval.total_seconds()),
+            }
+        )
+        self._tier_snapshots: dict[str, dict[Hashable, Any]] = {}
+
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.push_updates = 0
+
+        # Fetch shared by concurrent refreshes, and the time until which the
+        # last result is served again without a new request
+        self._refresh_task: asyncio.Task[dict[str, Any]] | None = None
+        self._dispatched_task: asyncio.Task[dict[str, Any]] | None = None
+        self._fresh_until: float | None = None
+        self.coalesced_refreshes = 0
+
+        # Raw payloads are appended to a capture log when enabled
+        self.capture = capture
+
+        # Set up when commands are enabled
+        self.writer: CommandWriter | None = None
+
+        # Requests are paused while the controller is unreachable
+        self.breaker = CircuitBreaker(
+            BREAKER_FAILURE_THRESHOLD,
+            BREAKER_PROBE_INTERVAL,
+            BREAKER_MAX_PROBE_INTERVAL,
+        )
+        # Updated with the listeners, see is_stale
+        self.stale = False
+
+        # Per refresh timings of every stage, for diagnostics
+        self.stats = RefreshStats()
+        # Timing of the refresh whose result is about to be dispatched
+        self._undispatched: RefreshTiming | None = None
+        # Called after every refresh, failed ones included, unlike the
+        # listeners which are skipped after repeated failures
+        self._refresh_listeners: list[CALLBACK_TYPE] = []
+
+        # Last good payload, persisted to hydrate the entities at startup.
+        # cached_at is set while the data comes from that cache.
+        self._store = _cache_store(hass, entry)
+        self.cached_at: datetime | None = None
+        self.fetched_at: datetime | None = None
         
+        # No update_interval, the hub triggers the scheduled refreshes
         super().__init__(
             hass,
             _LOGGER,
+            config_entry=entry,
             name=f"{DOMAIN}_{entry.entry_id}",
-            update_interval=scan_interval,
+            update_interval=None,
         )
 
     async def _async_update_data(self) -> dict[str, Any]:
-        """Fetch data from API."""
-        url = f"http://{self.host}{self.path}"
+        """Fetch data from API, sharing a fetch already in flight.
+
+        Scheduled polls, manual refreshes and entity updates can all ask for
+        data at the same moment, the controller only sees one request.
+        """
+        if (
+            self._fresh_until is not None
+            and self.data is not None
+            and self.hass.loop.time() < self._fresh_until
+        ):
+            # Fetched a moment ago, serve it again, nothing changed since
+            self.coalesced_refreshes += 1
+            self.changed_sensors = set()
+            self.hub.async_reschedule(self)
+            return self.data
+
+        if self._refresh_task is None:
+            self._refresh_task = self.config_entry.async_create_background_task(
+                self.hass,
+                self._async_refresh_data(),
+                f"{DOMAIN} fetch {self.config_entry.entry_id}",
+            )
+            self._refresh_task.add_done_callback(self._async_refresh_done)
+        else:
+            self.coalesced_refreshes += 1
+
+        # Shielded so a cancelled caller does not cancel the others
+        task = self._refresh_task
+        data = await asyncio.shield(task)
+
+        # Every caller dispatches the result, only the first one resuming
+        # writes the changed entities
+        if task is self._dispatched_task:
+            self.changed_sensors = set()
+        self._dispatched_task = task
+        return data
+
+    @callback
+    def _async_refresh_done(self, task: asyncio.Task[dict[str, Any]]) -> None:
+        """Allow the next fetch to start."""
+        self._refresh_task = None
+        if not task.cancelled():
+            # Mark the exception as retrieved when every caller went away
+            task.exception()
+
+    async def _async_refresh_data(self) -> dict[str, Any]:
+        """Fetch data from API and pick the next poll interval."""
+        timing = RefreshTiming()
+        # Left over when the listeners were not told about the last failure
+        self._undispatched = None
+        start = time.perf_counter()
+        try:
+            if self.breaker.is_open:
+                await self._async_probe_controller()
+
+            # Cap the requests in flight across all pools
+            async with self.hub.semaphore:
+                data = await self._async_fetch_data(timing)
+        except UpdateFailed as err:
+            timing.error = str(err)
+            was_open = self.breaker.is_open
+            interval = self.poll_interval
+            if not isinstance(err, ControllerUnreachable):
+                self._async_record_failure()
+            if self.scheduler is not None:
+                self._async_set_interval(self.scheduler.record_failure())
+
+            # The listeners are no longer updated after the second failure
+            # in a row, update the entities following the outage here
+            if (
+                self.breaker.is_open != was_open
+                or self.is_stale != self.stale
+                or self.poll_interval != interval
+            ):
+                # Only a staleness flip rewrites the sensors
+                self.changed_sensors = set()
+                self.async_update_listeners()
+                self.changed_sensors = set()
+            raise
+        else:
+            if self.scheduler is not None:
+                self._async_set_interval(
+                    self.scheduler.record_success(self.changed_sensors)
+                )
+            self._async_record_success()
+            return data
+        finally:
+            timing.total = time.perf_counter() - start
+            self.stats.record(timing)
+            self._undispatched = timing
+            self.hub.async_record_poll(self, timing.total, timing.error is None)
+            for refresh_listener in self._refresh_listeners:
+                refresh_listener()
+
+    @callback
+    def async_add_refresh_listener(
+        self, refresh_listener: CALLBACK_TYPE
+    ) -> CALLBACK_TYPE:
+        """Call a function after every refresh, and return a function removing it."""
+        self._refresh_listeners.append(refresh_listener)
+
+        @callback
+        def _async_remove_refresh_listener() -> None:
+            self._refresh_listeners.remove(refresh_listener)
+
+        return _async_remove_refresh_listener
+
+    async def _async_probe_controller(self) -> None:
+        """Check with a bare TCP connection that the controller is back.
+
+        Raise ControllerUnreachable while no probe is due or when it fails.
+        """
+        now = self.hass.loop.time()
+        if not self.breaker.probe_due(now):
+            delay = self.breaker.next_probe - now
+            raise ControllerUnreachable(
+                f"Controller unreachable, next probe in {delay:.0f} s"
+            )
+
+        url = URL(f"http://{self.host}")
+        try:
+            async with async_timeout.timeout(self.connect_timeout):
+                _, writer = await asyncio.open_connection(url.host, url.port)
+        except (OSError, asyncio.TimeoutError) as err:
+            self.breaker.record_failure(self.hass.loop.time())
+            raise ControllerUnreachable(
+                f"Controller unreachable: {type(err).__name__}"
+            ) from err
+        writer.close()
+        _LOGGER.debug("Pool controller at %s accepts connections again", self.host)
+
+    @callback
+    def _async_record_failure(self) -> None:
+        """Count a failed request towards opening the circuit breaker."""
+        was_open = self.breaker.is_open
+        self.breaker.record_failure(self.hass.loop.time())
+        if self.breaker.is_open and not was_open:
+            _LOGGER.warning(
+                "Pool controller at %s failed %s times in a row, pausing requests",
+                self.host,
+                self.breaker.failures,
+            )
+
+    async def _async_fetch_data(self, timing: RefreshTiming) -> dict[str, Any]:
+        """Fetch the endpoints that are due and merge their data."""
+        self.changed_sensors = set()
+        now = self.hass.loop.time()
+        due = [
+            endpoint
+            for endpoint in self.endpoints
+            if self.data is None or endpoint.is_due(now)
+        ]
+
+        # The endpoints of different tiers are fetched concurrently
+        results = await asyncio.gather(
+            *(self._async_fetch_endpoint(endpoint, timing) for endpoint in due)
+        )
+        payloads = {
+            endpoint.path: payload
+            for endpoint, payload in zip(due, results)
+            if payload is not None
+        }
+        tiers = {
+            tier
+            for endpoint in due
+            if endpoint.path in payloads
+            for tier in endpoint.tiers
+        }
+        if not tiers and self.data is not None:
+            fetched_at = self.hass.loop.time()
+            for endpoint in due:
+                endpoint.fetched_at = fetched_at
+            self._async_resample()
+            return self.data
+
+        decode_start = time.perf_counter()
+        data = merge_payloads(
+            payloads[endpoint.path].data
+            if endpoint.path in payloads
+            else endpoint.data
+            for endpoint in self.endpoints
+        )
+        try:
+            self._async_process_payload(data, tiers)
+        except ValueError as err:
+            _LOGGER.debug("Invalid pool data from %s: %s", self.host, err)
+            raise UpdateFailed(f"Invalid payload: {err}") from err
+        timing.decode = (timing.decode or 0) + time.perf_counter() - decode_start
+
+        # Only a processed payload is kept, a cycle failing before leaves the
+        # endpoints due with their previous state, to fetch it all again
+        fetched_at = self.hass.loop.time()
+        for endpoint in due:
+            if (payload := payloads.get(endpoint.path)) is not None:
+                endpoint.store(payload, fetched_at)
+            else:
+                endpoint.fetched_at = fetched_at
+        _LOGGER.debug("Successfully fetched pool data for tiers %s", tiers)
+        return data
+
+    async def _async_fetch_endpoint(
+        self, endpoint: Endpoint, timing: RefreshTiming
+    ) -> EndpointPayload | None:
+        """Fetch an endpoint and return its payload, None when unchanged.
+
+        The payload is only stored on the endpoint once it was processed.
+        """
+        url = f"http://{self.host}{endpoint.path}"
+        
+        # Let the controller answer 304 when it supports conditional requests
+        headers = {}
+        if endpoint.etag is not None:
+            headers[hdrs.IF_NONE_MATCH] = endpoint.etag
+        if endpoint.last_modified is not None:
+            headers[hdrs.IF_MODIFIED_SINCE] = endpoint.last_modified
         
         try:
-            async with async_timeout.timeout(10):
-                async with self.session.get(url) as response:
+            request_start = time.perf_counter()
+            async with async_timeout.timeout(self.timeout):
+                async with self.session.get(
+                    url, headers=headers, trace_request_ctx=timing
+                ) as response:
+                    timing.ttfb = max(
+                        timing.ttfb or 0, time.perf_counter() - request_start
+                    )
+
+                    if response.status == 304 and endpoint.data is not None:
+                        self.cache_hits += 1
+                        _LOGGER.debug("Pool data at %s not modified", endpoint.path)
+                        return None
+
                     if response.status != 200:
                         # Use debug level to avoid log spam
                         _LOGGER.debug(
@@ -111,16 +649,413 @@ class PoolDataUpdateCoordinator(DataUpdateCoordinator):
                         )
                         raise UpdateFailed(f"HTTP error {response.status}")
                     
-                    data = await response.json()
-                    _LOGGER.debug("Successfully fetched pool data")
-                    return data
+                    etag = response.headers.get(hdrs.ETAG)
+                    last_modified = response.headers.get(hdrs.LAST_MODIFIED)
+                    read_start = time.perf_counter()
+                    body = await async_read_body(response, MAX_PAYLOAD_SIZE)
+                    timing.body_read = max(
+                        timing.body_read or 0, time.perf_counter() - read_start
+                    )
+                    timing.payload_size = (timing.payload_size or 0) + len(body)
+                    self._async_capture(endpoint.path, body)
+
+                    # Fall back to hashing for controllers without validators
+                    digest = hashlib.blake2b(body, digest_size=16).digest()
+                    if digest == endpoint.digest and endpoint.data is not None:
+                        self.cache_hits += 1
+                        _LOGGER.debug("Pool data at %s unchanged", endpoint.path)
+                        return None
+
+                    self.cache_misses += 1
+                    decode_start = time.perf_counter()
+                    data = decode_payload(body)
+                    timing.decode = (timing.decode or 0) + (
+                        time.perf_counter() - decode_start
+                    )
+                    return EndpointPayload(data, digest, etag, last_modified)
                     
+        except UpdateFailed:
+            raise
         except aiohttp.ClientError as err:
             _LOGGER.debug("Connection error fetching pool data from %s: %s", url, err)
             raise UpdateFailed(f"Connection error: {err}") from err
         except asyncio.TimeoutError as err:
             _LOGGER.debug("Timeout fetching pool data from %s", url)
             raise UpdateFailed("Timeout connecting to pool") from err
+        except ValueError as err:
+            _LOGGER.debug("Invalid pool data from %s: %s", url, err)
+            raise UpdateFailed(f"Invalid payload: {err}") from err
         except Exception as err:
-            _LOGGER.debug("Unexpected error fetching pool data from %s: %s", url, err)
-            raise UpdateFailed(f"Unexpected error: {err}") from err
+            _LOGGER.debug(
+                "Unexpected error fetching pool data from %s", url, exc_info=True
+            )
+            raise UpdateFailed(
+                f"Unexpected error: {type(err).__name__}: {err}"
+            ) from err
+
+    @callback
+    def _async_capture(self, path: str, body: bytes) -> None:
+        """Append a raw payload to the capture log, if enabled."""
+        if self.capture is not None:
+            self.hass.async_add_executor_job(
+                self._write_capture, time.time(), path, body
+            )
+
+    def _write_capture(self, when: float, path: str, body: bytes) -> None:
+        """Append a raw payload to the capture log, from the executor."""
+        try:
+            self.capture.write(when, path, body)
+        except OSError as err:
+            _LOGGER.warning("Could not write to the capture log: %s", err)
+
+    @callback
+    def _async_parse_body(self, endpoint: Endpoint, body: bytes) -> dict[str, Any]:
+        """Return the data of a pushed payload, decoding it only when it changed.
+
+        The payload is merged with the data of the other endpoints, as a
+        poll does, and kept once processed.
+        """
+        digest = hashlib.blake2b(body, digest_size=16).digest()
+        if digest == endpoint.digest and endpoint.data is not None:
+            self.cache_hits += 1
+            _LOGGER.debug("Pool data at %s unchanged", endpoint.path)
+            self._async_resample()
+            return self.data
+
+        self.cache_misses += 1
+        payload = EndpointPayload(decode_payload(body), digest)
+        data = merge_payloads(
+            payload.data if other is endpoint else other.data
+            for other in self.endpoints
+        )
+        self._async_process_payload(data, endpoint.tiers)
+        endpoint.store(payload, self.hass.loop.time())
+        return data
+
+    @callback
+    def _async_record_success(self, captured_at: float | None = None) -> None:
+        """Update the derived metrics and the cache after fresh data was received.
+
+        A replayed payload passes the time it was captured at, which the
+        derived metrics and the alarm delays then follow.
+        """
+        if self.breaker.is_open:
+            _LOGGER.info("Pool controller at %s is reachable again", self.host)
+        self.breaker.record_success()
+        self.fetched_at = dt_util.utcnow()
+        self._fresh_until = self.hass.loop.time() + FRESHNESS_WINDOW
+        self._async_update_derived(captured_at)
+        self._async_evaluate_alarms(captured_at)
+        if self.cached_at is not None:
+            # Rewrite every sensor to drop the staleness attributes
+            self.cached_at = None
+            self.generation += 1
+            self.changed_sensors = self._entity_keys()
+        if self.changed_sensors:
+            self._store.async_delay_save(self._cache_data, STORAGE_SAVE_DELAY)
+
+    @callback
+    def _async_update_derived(self, captured_at: float | None = None) -> None:
+        """Update the derived metrics from the last measured values."""
+        now = (
+            dt_util.now()
+            if captured_at is None
+            else dt_util.as_local(dt_util.utc_from_timestamp(captured_at))
+        )
+        for key, metric in self.derived.items():
+            previous = metric.value
+            metric.update(now, self._measurements)
+            if metric.value != previous:
+                self.changed_sensors.add(key)
+
+    @callback
+    def _async_evaluate_alarms(self, captured_at: float | None = None) -> None:
+        """Evaluate the alarm rules against the last measured values."""
+        # Only the time elapsed between evaluations matters, a replay only
+        # ever passes capture times
+        now = self.hass.loop.time() if captured_at is None else captured_at
+        derived = {key: metric.value for key, metric in self.derived.items()}
+        self.changed_sensors.update(
+            self.alarms.evaluate(now, ChainMap(self._measurements, derived))
+        )
+
+    @callback
+    def _entity_keys(self) -> set[str]:
+        """Return the keys of every entity following the snapshot."""
+        return (
+            {description.key for description in self.descriptions}
+            | self.derived.keys()
+            | {rule.key for rule in self.alarms.rules}
+        )
+
+    @callback
+    def async_apply_optimistic(self, path: Sequence[PathKey], value: Any) -> None:
+        """Show a commanded value until a refresh confirms or reverts it."""
+        if self.data is None:
+            return
+
+        data = copy.deepcopy(self.data)
+        try:
+            target = data
+            for key in path[:-1]:
+                target = target[key]
+            target[path[-1]] = value
+        except (KeyError, IndexError, TypeError):
+            _LOGGER.debug("Path %s not found in pool data", path)
+            return
+
+        # The confirming refresh must process the payload even if the
+        # controller ignored the command
+        for endpoint in self.endpoints:
+            endpoint.invalidate()
+        try:
+            self._async_process_payload(data)
+        except ValueError as err:
+            # The command stays sent, the refresh shows its outcome
+            _LOGGER.debug("Not showing the commanded value of %s: %s", path, err)
+            return
+        self.async_set_updated_data(data)
+
+    async def async_refresh_now(self) -> None:
+        """Refresh without reusing the result of a recent fetch."""
+        self._fresh_until = None
+        await self.async_refresh()
+
+    @callback
+    def async_ingest_payload(
+        self, body: bytes, path: str | None = None, captured_at: float | None = None
+    ) -> None:
+        """Feed a payload pushed by the controller, a local relay or a replay.
+
+        The payload is the one of the endpoint at path, the main endpoint by
+        default. Raises ValueError when the path is not an endpoint or the
+        payload cannot be decoded or is rejected.
+        """
+        path = path or self.path
+        for endpoint in self.endpoints:
+            if endpoint.path == path:
+                break
+        else:
+            raise ValueError(f"Not an endpoint of the pool: {path}")
+
+        self.changed_sensors = set()
+        self._async_capture(path, body)
+        data = self._async_parse_body(endpoint, body)
+        self.push_updates += 1
+        self._async_record_success(captured_at)
+
+        # Postpone the watchdog poll, the data was just refreshed
+        self.hub.async_reschedule(self)
+        self.async_set_updated_data(data)
+
+    async def async_load_cache(self) -> bool:
+        """Hydrate the coordinator from the persisted payload.
+
+        Return whether a cached payload was found.
+        """
+        if (cache := await self._store.async_load()) is None:
+            return False
+
+        try:
+            self.cached_at = self.fetched_at = dt_util.parse_datetime(
+                cache["fetched_at"]
+            )
+            for key, state in cache.get("derived", {}).items():
+                if (metric := self.derived.get(key)) is not None:
+                    metric.restore(state)
+            self._async_process_payload(cache["data"])
+        except (KeyError, TypeError, ValueError) as err:
+            # Written by another version, or rejected by the current schema
+            _LOGGER.warning("Dropping the cached pool data: %s", err)
+            self.cached_at = self.fetched_at = None
+            self.derived = {
+                description.key: description.metric()
+                for description in DERIVED_SENSOR_DEFINITIONS
+            }
+            await self._store.async_remove()
+            return False
+
+        self.async_set_updated_data(cache["data"])
+        _LOGGER.debug("Loaded pool data cached at %s", cache["fetched_at"])
+        return True
+
+    @callback
+    def _cache_data(self) -> dict[str, Any]:
+        """Return the payload and the derived metrics to persist."""
+        return {
+            "data": self.data,
+            "fetched_at": self.fetched_at.isoformat(),
+            "derived": {key: metric.as_dict() for key, metric in self.derived.items()},
+        }
+
+    @callback
+    def async_set_updated_data(self, data: dict[str, Any]) -> None:
+        """Dispatch data that did not come from a refresh."""
+        # Pushed payloads and commands do not belong to the last refresh
+        self._undispatched = None
+        super().async_set_updated_data(data)
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update all registered listeners, timing the dispatch of a refresh."""
+        if (stale := self.is_stale) != self.stale:
+            # Rewrite every sensor to update its availability
+            self.stale = stale
+            self.changed_sensors = self._entity_keys()
+
+        timing, self._undispatched = self._undispatched, None
+        start = time.perf_counter()
+        super().async_update_listeners()
+        if timing is not None:
+            timing.dispatch = time.perf_counter() - start
+
+    @property
+    def is_stale(self) -> bool:
+        """Return whether nothing was fetched for several poll intervals.
+
+        Values hydrated from the cache are flagged by their attributes instead.
+        """
+        if self.cached_at is not None or self.fetched_at is None:
+            return False
+        return dt_util.utcnow() - self.fetched_at > STALE_INTERVALS * self.poll_interval
+
+    @callback
+    def _async_set_interval(self, interval: timedelta) -> None:
+        """Use a new interval for the next scheduled poll."""
+        if interval != self.poll_interval:
+            _LOGGER.debug(
+                "Pool poll interval changed to %s seconds",
+                interval.total_seconds(),
+            )
+            self.poll_interval = interval
+
+    @callback
+    def _async_process_payload(
+        self, data: Any, tiers: Collection[str] | None = None
+    ) -> None:
+        """Resolve and normalize the sensor values of a new payload.
+
+        Only the sensors of the given tiers are resolved again, those of the
+        other tiers keep their values. Raise CorruptPayload, a ValueError,
+        when the payload cannot be trusted.
+        """
+        shape = shape_signature(data, self._template_prefixes)
+        if shape != self.shape:
+            _LOGGER.debug("Pool payload shape changed to %s", shape)
+            self.shape = shape
+            self.descriptions = expand_sensor_descriptions(
+                SENSOR_DEFINITIONS, self._template_prefixes, shape
+            )
+            self.paths = _compile_tier_paths(self.descriptions)
+            self.schema = CompiledSchema(self.descriptions)
+            self._async_update_publishers()
+            tiers = None
+
+        resolved = {
+            tier: paths.resolve(data)
+            for tier, paths in self.paths.items()
+            if tiers is None or tier in tiers or tier not in self._tier_snapshots
+        }
+
+        # Only the values resolved again are normalized, the tiers kept from
+        # earlier payloads were normalized when they were resolved
+        fresh: dict[Hashable, Any] = {}
+        for tier_snapshot in resolved.values():
+            fresh.update(tier_snapshot)
+        try:
+            if violations := self.schema.normalize(fresh):
+                self.schema_violations += violations
+                _LOGGER.debug("Dropped %s invalid values from pool data", violations)
+        except CorruptPayload:
+            self.dropped_frames += 1
+            raise
+
+        tier_snapshots = {
+            tier: (
+                {key: fresh[key] for key in resolved[tier] if key in fresh}
+                if tier in resolved
+                else self._tier_snapshots[tier]
+            )
+            for tier in self.paths
+        }
+        snapshot: dict[Hashable, Any] = {}
+        for tier_snapshot in tier_snapshots.values():
+            snapshot.update(tier_snapshot)
+        self._tier_snapshots = tier_snapshots
+        self._async_set_snapshot(snapshot)
+
+    @callback
+    def _async_update_publishers(self) -> None:
+        """Buffer the measurements of the current descriptions."""
+        if not self.publish_window:
+            return
+
+        # Keep the samples of the sensors that are still there
+        self.publishers = {
+            description.key: self.publishers.get(description.key)
+            or MetricPublisher(
+                BUFFER_CAPACITY, description.deadband, self.publish_window
+            )
+            for description in self.descriptions
+            if description.deadband is not None
+        }
+
+    @callback
+    def _async_buffer_measurements(self, snapshot: dict[Hashable, Any]) -> None:
+        """Hold back the measurements that do not need publishing yet."""
+        now = time.monotonic()
+        for key, publisher in self.publishers.items():
+            value = snapshot.get(key)
+            if not isinstance(value, (int, float)) or isinstance(value, bool):
+                continue
+
+            statistic_keys = [(key, name) for name in STATISTIC_ATTRIBUTES]
+            if not publisher.offer(now, value):
+                # Keep the published state and its statistics
+                for snapshot_key in (key, *statistic_keys):
+                    if snapshot_key in self.snapshot:
+                        snapshot[snapshot_key] = self.snapshot[snapshot_key]
+                continue
+
+            statistics = publisher.buffer.statistics(now - publisher.window)
+            if statistics is None:
+                continue
+            fields = STATISTIC_ATTRIBUTES.values()
+            for snapshot_key, field in zip(statistic_keys, fields):
+                snapshot[snapshot_key] = round(getattr(statistics, field), 3)
+
+    @callback
+    def _async_resample(self) -> None:
+        """Sample the measurements of an unchanged payload again.
+
+        The buffers then hold one sample per poll, as if each poll had
+        brought a new payload, instead of one per change.
+        """
+        if self.publishers and self._measurements:
+            self._async_set_snapshot(dict(self._measurements))
+
+    @callback
+    def _async_set_snapshot(self, snapshot: dict[Hashable, Any]) -> None:
+        """Store a new snapshot and record which sensors changed."""
+        if self.publishers:
+            # Buffering replaces the measurements with the published values
+            self._measurements = dict(snapshot)
+            self._async_buffer_measurements(snapshot)
+        else:
+            self._measurements = snapshot
+        self.changed_sensors = {
+            key if isinstance(key, str) else key[0]
+            for key in diff_snapshots(self.snapshot, snapshot)
+        }
+        self.snapshot = snapshot
+        self.generation += 1
+
+    @callback
+    def async_should_write(self, key: str) -> bool:
+        """Return whether the sensor with this key needs a state write."""
+        if key in self.changed_sensors:
+            self.state_writes += 1
+            return True
+
+        self.skipped_writes += 1
+        return False
@@ -0,0 +1,92 @@
+"""Support for Pool Monitor binary sensors."""
+from __future__ import annotations
+
+from homeassistant.components.binary_sensor import (
+    BinarySensorDeviceClass,
+    BinarySensorEntity,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EntityCategory
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from . import PoolDataUpdateCoordinator
+from .const import DOMAIN
+from .entity import PoolEntity
+from .rules import AlarmRule
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up Pool Monitor binary sensors from a config entry."""
+    coordinator: PoolDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    async_add_entities(
+        [
+            PoolUnreachableSensor(coordinator=coordinator, entry=entry),
+            *(
+                PoolAlarmSensor(coordinator=coordinator, entry=entry, rule=rule)
+                for rule in coordinator.alarms.rules
+            ),
+        ]
+    )
+
+
+class PoolUnreachableSensor(PoolEntity, BinarySensorEntity):
+    """On while the circuit breaker pauses the requests to the controller."""
+
+    _attr_name = "Controller Unreachable"
+    _attr_device_class = BinarySensorDeviceClass.PROBLEM
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(
+        self,
+        coordinator: PoolDataUpdateCoordinator,
+        entry: ConfigEntry,
+    ) -> None:
+        """Initialize the binary sensor."""
+        super().__init__(coordinator, entry, "controller_unreachable")
+
+        self._attr_is_on = coordinator.breaker.is_open
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        if self.coordinator.breaker.is_open != self._attr_is_on:
+            self._attr_is_on = self.coordinator.breaker.is_open
+            self.async_write_ha_state()
+
+    @property
+    def available(self) -> bool:
+        """Return if entity is available."""
+        # Reports on the coordinator, so it stays meaningful when polls fail
+        return True
+
+
+class PoolAlarmSensor(PoolEntity, BinarySensorEntity):
+    """On while an alarm rule is active."""
+
+    _attr_device_class = BinarySensorDeviceClass.PROBLEM
+
+    def __init__(
+        self,
+        coordinator: PoolDataUpdateCoordinator,
+        entry: ConfigEntry,
+        rule: AlarmRule,
+    ) -> None:
+        """Initialize the binary sensor."""
+        super().__init__(coordinator, entry, rule.key)
+
+        self._attr_name = rule.name
+        self._attr_is_on = coordinator.alarms.is_active(rule.key)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        # The engine lists a rule as changed only when it flips
+        if self.coordinator.async_should_write(self.key):
+            self._attr_is_on = self.coordinator.alarms.is_active(self.key)
+            self.async_write_ha_state()
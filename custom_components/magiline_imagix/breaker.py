@@ -0,0 +1,47 @@
+"""Circuit breaker pausing the requests to an unreachable controller."""
+from __future__ import annotations
+
+
+class CircuitBreaker:
+    """Open after consecutive failures and probe on a backoff schedule.
+
+    While open, the caller skips its requests until a probe is due. When a
+    probe gets through the next request decides, a success closes the
+    breaker and a failure doubles the wait before the next probe.
+    """
+
+    def __init__(self, threshold: int, base: float, ceiling: float) -> None:
+        """Initialize the breaker."""
+        self.threshold = threshold
+        self.base = base
+        self.ceiling = ceiling
+        self.failures = 0
+        self.backoff = base
+        self.opened_at: float | None = None
+        self.next_probe = 0.0
+
+    @property
+    def is_open(self) -> bool:
+        """Return whether requests are paused."""
+        return self.opened_at is not None
+
+    def probe_due(self, now: float) -> bool:
+        """Return whether the controller should be probed again."""
+        return now >= self.next_probe
+
+    def record_success(self) -> None:
+        """Close the breaker after a successful request."""
+        self.failures = 0
+        self.backoff = self.base
+        self.opened_at = None
+
+    def record_failure(self, now: float) -> None:
+        """Count a failure, opening the breaker or backing off its probes."""
+        self.failures += 1
+        if self.opened_at is None:
+            if self.failures < self.threshold:
+                return
+            self.opened_at = now
+        else:
+            self.backoff = min(self.backoff * 2, self.ceiling)
+        self.next_probe = now + self.backoff
@@ -0,0 +1,106 @@
+"""Buffering of measurements between published sensor states.
+
+Every refresh is sampled into a fixed size ring buffer, but the sensor state
+is only published when the value moved by more than a deadband or when the
+publish window elapsed, so short scan intervals do not flood the recorder.
+"""
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass
+import math
+
+
+@dataclass(slots=True)
+class MetricStatistics:
+    """Statistics of the samples of a window."""
+
+    count: int
+    minimum: float
+    maximum: float
+    mean: float
+    stddev: float
+
+
+class MetricBuffer:
+    """Ring buffer of timestamped samples, preallocated on creation."""
+
+    __slots__ = ("_times", "_values", "_next", "_size")
+
+    def __init__(self, capacity: int) -> None:
+        """Initialize the buffer."""
+        self._times = array("d", bytes(8 * capacity))
+        self._values = array("d", bytes(8 * capacity))
+        self._next = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        """Return the number of samples held."""
+        return self._size
+
+    def append(self, when: float, value: float) -> None:
+        """Add a sample, overwriting the oldest one when full."""
+        self._times[self._next] = when
+        self._values[self._next] = value
+        self._next = (self._next + 1) % len(self._values)
+        self._size = min(self._size + 1, len(self._values))
+
+    def statistics(self, since: float) -> MetricStatistics | None:
+        """Return the statistics of the samples taken at or after a time."""
+        capacity = len(self._values)
+        count = 0
+        mean = m2 = 0.0
+        minimum = math.inf
+        maximum = -math.inf
+
+        # Walk from the newest sample back, samples are in time order
+        for offset in range(1, self._size + 1):
+            index = (self._next - offset) % capacity
+            if self._times[index] < since:
+                break
+            value = self._values[index]
+            count += 1
+            delta = value - mean
+            mean += delta / count
+            m2 += delta * (value - mean)
+            minimum = min(minimum, value)
+            maximum = max(maximum, value)
+
+        if not count:
+            return None
+        return MetricStatistics(
+            count=count,
+            minimum=minimum,
+            maximum=maximum,
+            mean=mean,
+            stddev=math.sqrt(m2 / count),
+        )
+
+
+class MetricPublisher:
+    """Decide when a buffered measurement is published."""
+
+    __slots__ = ("buffer", "deadband", "window", "value", "published_at")
+
+    def __init__(self, capacity: int, deadband: float, window: float) -> None:
+        """Initialize the publisher."""
+        self.buffer = MetricBuffer(capacity)
+        self.deadband = deadband
+        self.window = window
+        self.value: float | None = None
+        self.published_at: float | None = None
+
+    def offer(self, when: float, value: float) -> bool:
+        """Sample a value and return whether it should be published."""
+        self.buffer.append(when, value)
+        if (
+            self.value is not None
+            and self.published_at is not None
+            and abs(value - self.value) < self.deadband
+            and when - self.published_at < self.window
+        ):
+            return False
+
+        self.value = value
+        self.published_at = when
+        return True
@@ -0,0 +1,98 @@
+"""Capture log of the raw payloads received from the controller.
+
+Frames are appended to ``capture.log`` as a header packing the receive
+time, the endpoint path length and the compressed body length, followed
+by the path and the zlib compressed body. The log rotates to numbered
+backups, bounding the disk used to ``max_bytes * (backups + 1)``.
+"""
+from __future__ import annotations
+
+from collections.abc import Iterator
+import mmap
+import os
+import pathlib
+import struct
+import threading
+import zlib
+
+CAPTURE_FILE = "capture.log"
+
+# Receive time, path length, compressed body length
+_HEADER = struct.Struct(">dHI")
+
+
+class CaptureWriter:
+    """Append frames to a rotating capture log, from executor threads."""
+
+    def __init__(self, directory: pathlib.Path, max_bytes: int, backups: int) -> None:
+        """Initialize the writer."""
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self._lock = threading.Lock()
+
+    def write(self, when: float, path: str, body: bytes) -> None:
+        """Append a frame, rotating the log first when it is full."""
+        encoded_path = path.encode()
+        compressed = zlib.compress(body)
+        frame = (
+            _HEADER.pack(when, len(encoded_path), len(compressed))
+            + encoded_path
+            + compressed
+        )
+
+        with self._lock:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            log = self.directory / CAPTURE_FILE
+            if log.exists() and log.stat().st_size + len(frame) > self.max_bytes:
+                self._rotate()
+            with log.open("ab") as file:
+                file.write(frame)
+
+    def _rotate(self) -> None:
+        """Shift the backups by one, dropping the oldest."""
+        for index in range(self.backups, 0, -1):
+            source = self.directory / (
+                f"{CAPTURE_FILE}.{index - 1}" if index > 1 else CAPTURE_FILE
+            )
+            if source.exists():
+                os.replace(source, self.directory / f"{CAPTURE_FILE}.{index}")
+        if not self.backups:
+            (self.directory / CAPTURE_FILE).unlink(missing_ok=True)
+
+
+def iter_log(log: pathlib.Path) -> Iterator[tuple[float, str, bytes]]:
+    """Yield the receive time, path and body of the frames of one log file.
+
+    The file is memory mapped, a frame cut by a crash ends the iteration.
+    """
+    if not log.stat().st_size:
+        return
+
+    with log.open("rb") as file, mmap.mmap(
+        file.fileno(), 0, access=mmap.ACCESS_READ
+    ) as mapped:
+        offset = 0
+        size = len(mapped)
+        while offset + _HEADER.size <= size:
+            when, path_length, body_length = _HEADER.unpack_from(mapped, offset)
+            offset += _HEADER.size
+            end = offset + path_length + body_length
+            if end > size:
+                return
+            path = mapped[offset : offset + path_length].decode()
+            body = zlib.decompress(mapped[offset + path_length : end])
+            offset = end
+            yield when, path, body
+
+
+def iter_capture(directory: pathlib.Path) -> Iterator[tuple[float, str, bytes]]:
+    """Yield the frames of a capture directory, oldest first."""
+    backups = sorted(
+        directory.glob(f"{CAPTURE_FILE}.*"),
+        key=lambda log: int(log.suffix[1:]),
+        reverse=True,
+    )
+    for log in (*backups, directory / CAPTURE_FILE):
+        if log.exists():
+            yield from iter_log(log)
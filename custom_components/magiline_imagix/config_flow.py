@@ -13,29 +13,89 @@ from homeassistant import config_entries
 from homeassistant.const import CONF_HOST
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.selector import TextSelector, TextSelectorConfig
 
-from .const import DOMAIN, CONF_PATH, DEFAULT_PATH, CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
+from .const import (
+    DOMAIN,
+    CONF_PATH,
+    DEFAULT_PATH,
+    CONF_SCAN_INTERVAL,
+    DEFAULT_SCAN_INTERVAL,
+    CONF_ADAPTIVE_POLLING,
+    DEFAULT_ADAPTIVE_POLLING,
+    CONF_MAX_SCAN_INTERVAL,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    CONF_PUSH,
+    DEFAULT_PUSH,
+    CONF_PUBLISH_WINDOW,
+    DEFAULT_PUBLISH_WINDOW,
+    CONF_CAPTURE,
+    DEFAULT_CAPTURE,
+    CONF_ALARM_RULES,
+    DEFAULT_ALARM_RULES,
+    CONF_METRICS,
+    DEFAULT_METRICS,
+    CONF_COMMAND_PATH,
+    DEFAULT_COMMAND_PATH,
+    CONF_SLOW_PATH,
+    DEFAULT_SLOW_PATH,
+    CONF_SLOW_SCAN_INTERVAL,
+    DEFAULT_SLOW_SCAN_INTERVAL,
+    CONF_CONNECT_TIMEOUT,
+    DEFAULT_CONNECT_TIMEOUT,
+    CONF_READ_TIMEOUT,
+    DEFAULT_READ_TIMEOUT,
+    MAX_PAYLOAD_SIZE,
+)
+from .decode import async_read_body, decode_payload
+from .discovery import DiscoveredController, async_discover
+from .rules import parse_rules
+from .session import create_session
 
 _LOGGER = logging.getLogger(__name__)
 
+# Choice of the discovered hosts leading to the manual step
+MANUAL_HOST = "manual"
 
-async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
-    """Validate the user input allows us to connect."""
+
+async def _async_probe(
+    session: aiohttp.ClientSession, url: str, timeout: float
+) -> None:
+    """Fetch and decode a payload from the controller."""
+    async with (
+        async_timeout.timeout(timeout),
+        session.get(url) as response,
+    ):
+        if response.status != 200:
+            raise CannotConnect(f"HTTP {response.status}")
+        
+        # Try to parse as JSON to validate it's a valid API
+        decode_payload(await async_read_body(response, MAX_PAYLOAD_SIZE))
+
+
+async def validate_input(
+    hass: HomeAssistant,
+    data: dict[str, Any],
+    session: aiohttp.ClientSession | None = None,
+) -> dict[str, Any]:
+    """Validate the user input allows us to connect.
+
+    A session of a running coordinator can be passed to probe through its
+    connection instead of opening another one to the controller.
+    """
     host = data[CONF_HOST]
     path = data.get(CONF_PATH, DEFAULT_PATH)
     url = f"http://{host}{path}"
     
-    session = async_get_clientsession(hass)
+    connect_timeout = data.get(CONF_CONNECT_TIMEOUT, DEFAULT_CONNECT_TIMEOUT)
+    read_timeout = data.get(CONF_READ_TIMEOUT, DEFAULT_READ_TIMEOUT)
     
     try:
-        async with async_timeout.timeout(10):
-            async with session.get(url) as response:
-                if response.status != 200:
-                    raise CannotConnect(f"HTTP {response.status}")
-                
-                # Try to parse as JSON to validate it's a valid API
-                await response.json()
+        if session is None:
+            async with create_session(connect_timeout, read_timeout) as session:
+                await _async_probe(session, url, connect_timeout + read_timeout)
+        else:
+            await _async_probe(session, url, connect_timeout + read_timeout)
                 
     except aiohttp.ClientError as err:
         raise CannotConnect(f"Connection failed: {err}") from err
@@ -52,10 +112,52 @@ class PoolMonitorConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    def __init__(self) -> None:
+        """Initialize the flow."""
+        self._discovered: list[DiscoveredController] | None = None
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
-        """Handle the initial step."""
+        """Handle the initial step, picking a controller found on the LAN."""
+        if self._discovered is None:
+            configured = self._async_current_ids()
+            self._discovered = [
+                controller
+                for controller in await async_discover(self.hass)
+                if controller.host not in configured
+            ]
+
+        if not self._discovered:
+            return await self.async_step_manual()
+
+        if user_input is not None:
+            host = user_input[CONF_HOST]
+            if host == MANUAL_HOST:
+                return await self.async_step_manual()
+
+            await self.async_set_unique_id(host)
+            self._abort_if_unique_id_configured()
+            return self.async_create_entry(
+                title=f"Pool Monitor ({host})",
+                data={CONF_HOST: host, CONF_PATH: DEFAULT_PATH},
+            )
+
+        hosts = {
+            controller.host: f"{controller.host} ({controller.latency * 1000:.0f} ms)"
+            for controller in self._discovered
+        }
+        hosts[MANUAL_HOST] = "Enter manually"
+
+        return self.async_show_form(
+            step_id="user",
+            data_schema=vol.Schema({vol.Required(CONF_HOST): vol.In(hosts)}),
+        )
+
+    async def async_step_manual(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Handle a host entered by the user."""
         errors: dict[str, str] = {}
         
         if user_input is not None:
@@ -81,7 +183,7 @@ class PoolMonitorConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         )
 
         return self.async_show_form(
-            step_id="user",
+            step_id="manual",
             data_schema=data_schema,
             errors=errors,
         )
@@ -115,24 +217,76 @@ class PoolMonitorOptionsFlowHandler(config_entries.OptionsFlow):
         current_path = self.config_entry.options.get(
             CONF_PATH, self.config_entry.data.get(CONF_PATH, DEFAULT_PATH)
         )
+        current_slow_path = self.config_entry.options.get(
+            CONF_SLOW_PATH, DEFAULT_SLOW_PATH
+        )
+        current_slow_scan_interval = self.config_entry.options.get(
+            CONF_SLOW_SCAN_INTERVAL, DEFAULT_SLOW_SCAN_INTERVAL
+        )
+        current_command_path = self.config_entry.options.get(
+            CONF_COMMAND_PATH, DEFAULT_COMMAND_PATH
+        )
         current_scan_interval = self.config_entry.options.get(
             CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
         )
+        current_adaptive_polling = self.config_entry.options.get(
+            CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING
+        )
+        current_max_scan_interval = self.config_entry.options.get(
+            CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL
+        )
+        current_push = self.config_entry.options.get(CONF_PUSH, DEFAULT_PUSH)
+        current_publish_window = self.config_entry.options.get(
+            CONF_PUBLISH_WINDOW, DEFAULT_PUBLISH_WINDOW
+        )
+        current_capture = self.config_entry.options.get(CONF_CAPTURE, DEFAULT_CAPTURE)
+        current_metrics = self.config_entry.options.get(CONF_METRICS, DEFAULT_METRICS)
+        current_alarm_rules = self.config_entry.options.get(
+            CONF_ALARM_RULES, DEFAULT_ALARM_RULES
+        )
+        current_connect_timeout = self.config_entry.options.get(
+            CONF_CONNECT_TIMEOUT, DEFAULT_CONNECT_TIMEOUT
+        )
+        current_read_timeout = self.config_entry.options.get(
+            CONF_READ_TIMEOUT, DEFAULT_READ_TIMEOUT
+        )
 
         if user_input is not None:
             # Validate scan interval is positive
             if user_input.get(CONF_SCAN_INTERVAL, 0) <= 0:
                 errors["base"] = "invalid_scan_interval"
+            elif not _valid_rules(user_input.get(CONF_ALARM_RULES, "")):
+                errors["base"] = "invalid_alarm_rules"
             else:
-                # Validate connection to the new host/path before saving
+                host = user_input.get(CONF_HOST, current_host)
+                path = user_input.get(CONF_PATH, current_path)
+                coordinator = self.hass.data.get(DOMAIN, {}).get(
+                    self.config_entry.entry_id
+                )
+                # Validate connection to the new host/path before saving,
+                # a coordinator already polling it proves it works
                 try:
-                    await validate_input(
-                        self.hass,
-                        {
-                            CONF_HOST: user_input.get(CONF_HOST, current_host),
-                            CONF_PATH: user_input.get(CONF_PATH, current_path),
-                        },
-                    )
+                    if (
+                        coordinator is None
+                        or coordinator.host != host
+                        or coordinator.path != path
+                        or not coordinator.last_update_success
+                        or coordinator.data is None
+                    ):
+                        await validate_input(
+                            self.hass,
+                            {
+                                CONF_HOST: host,
+                                CONF_PATH: path,
+                                CONF_CONNECT_TIMEOUT: user_input.get(
+                                    CONF_CONNECT_TIMEOUT, current_connect_timeout
+                                ),
+                                CONF_READ_TIMEOUT: user_input.get(
+                                    CONF_READ_TIMEOUT, current_read_timeout
+                                ),
+                            },
+                            coordinator.session if coordinator is not None else None,
+                        )
                 except CannotConnect:
                     errors["base"] = "cannot_connect"
                 except Exception:  # pylint: disable=broad-except
@@ -146,9 +300,35 @@ class PoolMonitorOptionsFlowHandler(config_entries.OptionsFlow):
             {
                 vol.Required(CONF_HOST, default=current_host): str,
                 vol.Optional(CONF_PATH, default=current_path): str,
+                vol.Optional(CONF_COMMAND_PATH, default=current_command_path): str,
                 vol.Optional(
                     CONF_SCAN_INTERVAL, default=current_scan_interval
                 ): vol.All(vol.Coerce(int), vol.Range(min=5, max=300)),
+                vol.Optional(CONF_SLOW_PATH, default=current_slow_path): str,
+                vol.Optional(
+                    CONF_SLOW_SCAN_INTERVAL, default=current_slow_scan_interval
+                ): vol.All(vol.Coerce(int), vol.Range(min=5, max=3600)),
+                vol.Optional(
+                    CONF_ADAPTIVE_POLLING, default=current_adaptive_polling
+                ): bool,
+                vol.Optional(
+                    CONF_MAX_SCAN_INTERVAL, default=current_max_scan_interval
+                ): vol.All(vol.Coerce(int), vol.Range(min=5, max=3600)),
+                vol.Optional(CONF_PUSH, default=current_push): bool,
+                vol.Optional(
+                    CONF_PUBLISH_WINDOW, default=current_publish_window
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=3600)),
+                vol.Optional(
+                    CONF_ALARM_RULES, default=current_alarm_rules
+                ): TextSelector(TextSelectorConfig(multiline=True)),
+                vol.Optional(CONF_CAPTURE, default=current_capture): bool,
+                vol.Optional(CONF_METRICS, default=current_metrics): bool,
+                vol.Optional(
+                    CONF_CONNECT_TIMEOUT, default=current_connect_timeout
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=30)),
+                vol.Optional(
+                    CONF_READ_TIMEOUT, default=current_read_timeout
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=60)),
             }
         )
 
@@ -159,5 +339,14 @@ class PoolMonitorOptionsFlowHandler(config_entries.OptionsFlow):
         )
 
 
+def _valid_rules(text: str) -> bool:
+    """Return whether the extra alarm rules can be parsed."""
+    try:
+        parse_rules(text)
+    except ValueError:
+        return False
+    return True
+
+
 class CannotConnect(Exception):
     """Error to indicate we cannot connect."""
@@ -1,231 +1,538 @@
 """Constants for the Pool Monitor integration."""
+from __future__ import annotations
 
+from collections.abc import Callable
+from typing import Any
+from dataclasses import dataclass
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntityDescription,
+    SensorStateClass,
+)
 from homeassistant.const import (
     UnitOfTemperature,
     UnitOfPower,
     UnitOfEnergy,
+    UnitOfTime,
     PERCENTAGE,
 )
 
+from .derived import DailyDuration, DerivedMetric, EwmaRate, TimeToAlarm
+from .endpoints import TIER_FAST, TIER_SLOW
+from .paths import PathKey
+from .rules import AlarmRule
+
 DOMAIN = "magiline_imagix"
 
 CONF_PATH = "path"
 DEFAULT_PATH = "/api/v1/pool/info"
 
+# Endpoint of the slow tier of sensors, the main path when empty
+CONF_SLOW_PATH = "slow_path"
+DEFAULT_SLOW_PATH = ""
+
+CONF_SLOW_SCAN_INTERVAL = "slow_scan_interval"
+DEFAULT_SLOW_SCAN_INTERVAL = 300  # seconds
+
+# Capture log of the raw payloads, for replays
+CONF_CAPTURE = "capture"
+DEFAULT_CAPTURE = False
+CAPTURE_MAX_BYTES = 4 * 1024 * 1024  # bytes per log file
+CAPTURE_BACKUPS = 4  # rotated log files kept
+
+# OpenMetrics export of the values and fetch statistics
+CONF_METRICS = "metrics"
+DEFAULT_METRICS = False
+
+# Extra alarm rules, one per line such as "filter_clogging > 80 for 600"
+CONF_ALARM_RULES = "alarm_rules"
+DEFAULT_ALARM_RULES = ""
+
+# Path of the endpoint accepting commands, control entities are only
+# created when it is set
+CONF_COMMAND_PATH = "command_path"
+DEFAULT_COMMAND_PATH = ""
+
+# Commands sent this soon after each other are merged into one request
+COMMAND_DEBOUNCE = 1.0  # seconds
+
+# Top speed of the variable speed pumps, bounds both the speed sensor and
+# the speed setpoint
+PUMP_MAX_RPM = 3450
+
+# Codes of roller_state while the pool cover moves, other codes mean idle
+ROLLER_STATE_OPENING = 1
+ROLLER_STATE_CLOSING = 2
+
+# Filtration modes accepted by the controller, exposed as their raw codes
+# until their meaning is documented
+FILTRATION_MODE_CODES = (0, 1, 2, 3)
+
+# Scan of the local networks in the config flow
+DISCOVERY_PORT = 11000
+DISCOVERY_CONCURRENCY = 64  # addresses probed at once
+DISCOVERY_CONNECT_TIMEOUT = 0.5  # seconds
+DISCOVERY_READ_TIMEOUT = 3  # seconds
+
+CONF_CONNECT_TIMEOUT = "connect_timeout"
+DEFAULT_CONNECT_TIMEOUT = 3  # seconds
+
+CONF_READ_TIMEOUT = "read_timeout"
+DEFAULT_READ_TIMEOUT = 10  # seconds
+
+# Connection reuse of the session dedicated to each controller
+DNS_CACHE_TTL = 300  # seconds
+KEEPALIVE_TIMEOUT = 60  # seconds
+
+# Circuit breaker pausing the requests to an unreachable controller
+BREAKER_FAILURE_THRESHOLD = 3  # consecutive failures
+BREAKER_PROBE_INTERVAL = 30  # seconds before the first probe
+BREAKER_MAX_PROBE_INTERVAL = 900  # seconds
+
+# Sensors become unavailable when no data was fetched for this many intervals
+STALE_INTERVALS = 3
+
+# Refreshes asked for this soon after a fetch reuse its result
+FRESHNESS_WINDOW = 2  # seconds
+
+# Persisted last known payload
+STORAGE_VERSION = 1
+STORAGE_SAVE_DELAY = 60  # seconds
+
+# Refresh timings kept for diagnostics
+STATS_WINDOW = 100  # refreshes
+STATS_HISTOGRAM_BUCKETS = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)  # ms
+
+# Refuse payloads larger than this, the real one is a few kilobytes
+MAX_PAYLOAD_SIZE = 1024 * 1024  # bytes
+
 CONF_SCAN_INTERVAL = "scan_interval"
 DEFAULT_SCAN_INTERVAL = 30  # seconds
 
-# Comprehensive sensor definitions
-SENSOR_DEFINITIONS = [
-    # Pump Sensors (from state.cards.pumps[0])
-    {
-        "key": "pump_state",
-        "name": "Pump State",
-        "path": ["state", "cards", "pumps", 0, "state"],
-        "icon": "mdi:pump",
-    },
-    {
-        "key": "pump_rpm",
-        "name": "Pump Speed",
-        "path": ["state", "cards", "pumps", 0, "rpm"],
-        "icon": "mdi:pump",
-        "unit": "RPM",
-        "state_class": "measurement",
-    },
-    {
-        "key": "pump_power",
-        "name": "Pump Power",
-        "path": ["state", "cards", "pumps", 0, "power"],
-        "device_class": "power",
-        "unit": UnitOfPower.WATT,
-        "state_class": "measurement",
-    },
-    {
-        "key": "pump_power_total",
-        "name": "Pump Total Energy",
-        "path": ["state", "cards", "pumps", 0, "powerTotal"],
-        "device_class": "energy",
-        "unit": UnitOfEnergy.WATT_HOUR,
-        "state_class": "total_increasing",
-    },
-    {
-        "key": "pump_slab_close",
-        "name": "Pump Slab Closed",
-        "path": ["state", "cards", "pumps", 0, "slabClose"],
-        "icon": "mdi:valve",
-    },
-    {
-        "key": "pump_water_present",
-        "name": "Pump Water Present",
-        "path": ["state", "cards", "pumps", 0, "waterPresent"],
-        "icon": "mdi:water-check",
-    },
-    
+CONF_ADAPTIVE_POLLING = "adaptive_polling"
+DEFAULT_ADAPTIVE_POLLING = False
+
+CONF_MAX_SCAN_INTERVAL = "max_scan_interval"
+DEFAULT_MAX_SCAN_INTERVAL = 300  # seconds
+
+CONF_PUSH = "push"
+DEFAULT_PUSH = False
+
+# Poll interval while payloads are pushed, only to notice a silent push
+PUSH_WATCHDOG_INTERVAL = 300  # seconds
+
+# Buffered measurements are published when they move by more than their
+# deadband or after this window, 0 publishes every change
+CONF_PUBLISH_WINDOW = "publish_window"
+DEFAULT_PUBLISH_WINDOW = 0  # seconds
+BUFFER_CAPACITY = 720  # samples kept per measurement
+
+# Statistics of the publish window exposed as attributes, by MetricStatistics field
+STATISTIC_ATTRIBUTES = {
+    "samples": "count",
+    "min": "minimum",
+    "max": "maximum",
+    "mean": "mean",
+    "stddev": "stddev",
+}
+
+# Poll interval used by adaptive polling while the pool is active
+ADAPTIVE_FAST_INTERVAL = 5  # seconds
+# Adaptive polling backs off further while the controller fails
+ADAPTIVE_FAILURE_MAX_INTERVAL = 1800  # seconds
+
+# Scheduling of the polls of all pools by the shared hub
+HUB_TICK_INTERVAL = 1  # seconds
+# Successive pools start this fraction of the interval apart, the golden
+# ratio keeps any number of pools evenly spread
+HUB_STAGGER_RATIO = 0.6180339887498949
+HUB_MAX_CONCURRENT_POLLS = 4
+
+# Sensors whose changes mean something is moving or counting down, extra
+# instances of a templated sensor count as the template
+ACTIVITY_SENSORS = {
+    "roller_state",
+    "roller_position",
+    "pump_rpm",
+    "filtration_swimming_remain",
+    "filtration_pause_remain",
+}
+
+@dataclass(frozen=True, kw_only=True)
+class PoolSensorEntityDescription(SensorEntityDescription):
+    """Describes a sensor reading a value of the pool info payload."""
+
+    path: tuple[PathKey, ...]
+    # Extra state attributes as (name, path) pairs
+    attributes: tuple[tuple[str, tuple[PathKey, ...]], ...] = ()
+    # Smallest change published at once when measurements are buffered
+    deadband: float | None = None
+    # Type the value is coerced to, and plausible range of the value
+    value_type: type[int] | type[float] | None = None
+    bounds: tuple[float, float] | None = None
+    # Names of raw state codes, codes missing from it are kept as is
+    enum_map: tuple[tuple[Any, str], ...] = ()
+    # Refresh tier, slow sensors are read from an endpoint fetched less often
+    tier: str = TIER_FAST
+
+
+# Comprehensive sensor definitions, a "*" in a path creates one sensor
+# per element of that list in the payload
+SENSOR_DEFINITIONS: tuple[PoolSensorEntityDescription, ...] = (
+    # Pump Sensors (from each of state.cards.pumps)
+    PoolSensorEntityDescription(
+        key="pump_state",
+        name="Pump State",
+        path=("state", "cards", "pumps", "*", "state"),
+        icon="mdi:pump",
+    ),
+    PoolSensorEntityDescription(
+        key="pump_rpm",
+        name="Pump Speed",
+        path=("state", "cards", "pumps", "*", "rpm"),
+        icon="mdi:pump",
+        native_unit_of_measurement="RPM",
+        state_class=SensorStateClass.MEASUREMENT,
+        deadband=50,
+        value_type=int,
+        bounds=(0, PUMP_MAX_RPM),
+    ),
+    PoolSensorEntityDescription(
+        key="pump_power",
+        name="Pump Power",
+        path=("state", "cards", "pumps", "*", "power"),
+        device_class=SensorDeviceClass.POWER,
+        native_unit_of_measurement=UnitOfPower.WATT,
+        state_class=SensorStateClass.MEASUREMENT,
+        deadband=10,
+        value_type=float,
+        bounds=(0, 10000),
+    ),
+    PoolSensorEntityDescription(
+        key="pump_power_total",
+        name="Pump Total Energy",
+        path=("state", "cards", "pumps", "*", "powerTotal"),
+        device_class=SensorDeviceClass.ENERGY,
+        native_unit_of_measurement=UnitOfEnergy.WATT_HOUR,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_type=float,
+        bounds=(0, 1e9),
+    ),
+    PoolSensorEntityDescription(
+        key="pump_slab_close",
+        name="Pump Slab Closed",
+        path=("state", "cards", "pumps", "*", "slabClose"),
+        icon="mdi:valve",
+    ),
+    PoolSensorEntityDescription(
+        key="pump_water_present",
+        name="Pump Water Present",
+        path=("state", "cards", "pumps", "*", "waterPresent"),
+        icon="mdi:water-check",
+    ),
+
     # Electrolyzer Sensors (from state.cards.electrolyzer)
-    {
-        "key": "electrolyzer_state",
-        "name": "Electrolyzer State",
-        "path": ["state", "cards", "electrolyzer", "state"],
-        "icon": "mdi:water-plus",
-    },
-    
+    PoolSensorEntityDescription(
+        key="electrolyzer_state",
+        name="Electrolyzer State",
+        path=("state", "cards", "electrolyzer", "state"),
+        icon="mdi:water-plus",
+    ),
+
     # Spotlight Sensors (from state.spotlight)
-    {
-        "key": "spotlight_state",
-        "name": "Spotlight State",
-        "path": ["state", "spotlight", "state"],
-        "icon": "mdi:spotlight",
-    },
-    {
-        "key": "spotlight_mode",
-        "name": "Spotlight Mode",
-        "path": ["state", "spotlight", "mode"],
-        "icon": "mdi:spotlight",
-    },
-    
+    PoolSensorEntityDescription(
+        key="spotlight_state",
+        name="Spotlight State",
+        path=("state", "spotlight", "state"),
+        icon="mdi:spotlight",
+    ),
+    PoolSensorEntityDescription(
+        key="spotlight_mode",
+        name="Spotlight Mode",
+        path=("state", "spotlight", "mode"),
+        icon="mdi:spotlight",
+    ),
+
     # Roller Sensors (from state.roller)
-    {
-        "key": "roller_state",
-        "name": "Pool Cover State",
-        "path": ["state", "roller", "state"],
-        "icon": "mdi:window-shutter",
-    },
-    {
-        "key": "roller_mode",
-        "name": "Pool Cover Mode",
-        "path": ["state", "roller", "mode"],
-        "icon": "mdi:window-shutter",
-    },
-    {
-        "key": "roller_position",
-        "name": "Pool Cover Position",
-        "path": ["state", "roller", "position"],
-        "icon": "mdi:window-shutter",
-    },
-    
+    PoolSensorEntityDescription(
+        key="roller_state",
+        name="Pool Cover State",
+        path=("state", "roller", "state"),
+        icon="mdi:window-shutter",
+    ),
+    PoolSensorEntityDescription(
+        key="roller_mode",
+        name="Pool Cover Mode",
+        path=("state", "roller", "mode"),
+        icon="mdi:window-shutter",
+    ),
+    PoolSensorEntityDescription(
+        key="roller_position",
+        name="Pool Cover Position",
+        path=("state", "roller", "position"),
+        icon="mdi:window-shutter",
+        value_type=int,
+        bounds=(0, 100),
+    ),
+
     # Remote Sensors (from state.remote)
-    {
-        "key": "remote_number",
-        "name": "Remote Number",
-        "path": ["state", "remote", "number"],
-        "icon": "mdi:remote",
-    },
-    {
-        "key": "remote_state",
-        "name": "Remote State",
-        "path": ["state", "remote", "state"],
-        "icon": "mdi:remote",
-    },
-    
+    PoolSensorEntityDescription(
+        key="remote_number",
+        name="Remote Number",
+        path=("state", "remote", "number"),
+        icon="mdi:remote",
+        tier=TIER_SLOW,
+    ),
+    PoolSensorEntityDescription(
+        key="remote_state",
+        name="Remote State",
+        path=("state", "remote", "state"),
+        icon="mdi:remote",
+    ),
+
     # Filtration Sensors (from state.filtration)
-    {
-        "key": "filtration_mode",
-        "name": "Filtration Mode",
-        "path": ["state", "filtration", "mode"],
-        "icon": "mdi:filter",
-    },
-    {
-        "key": "filtration_actual_prog",
-        "name": "Filtration Program",
-        "path": ["state", "filtration", "actualProg"],
-        "icon": "mdi:filter-settings",
-    },
-    {
-        "key": "filtration_state",
-        "name": "Filtration State",
-        "path": ["state", "filtration", "state"],
-        "icon": "mdi:filter",
-    },
-    {
-        "key": "filtration_swimming_remain",
-        "name": "Swimming Mode Remaining Time",
-        "path": ["state", "filtration", "swimming", "remainTime"],
-        "icon": "mdi:timer-sand",
-        "unit": "min",
-        "state_class": "measurement",
-    },
-    {
-        "key": "filtration_pause_remain",
-        "name": "Pause Remaining Time",
-        "path": ["state", "filtration", "pause", "remainTime"],
-        "icon": "mdi:timer-pause",
-        "unit": "min",
-        "state_class": "measurement",
-    },
-    
+    PoolSensorEntityDescription(
+        key="filtration_mode",
+        name="Filtration Mode",
+        path=("state", "filtration", "mode"),
+        icon="mdi:filter",
+    ),
+    PoolSensorEntityDescription(
+        key="filtration_actual_prog",
+        name="Filtration Program",
+        path=("state", "filtration", "actualProg"),
+        icon="mdi:filter-settings",
+    ),
+    PoolSensorEntityDescription(
+        key="filtration_state",
+        name="Filtration State",
+        path=("state", "filtration", "state"),
+        icon="mdi:filter",
+    ),
+    PoolSensorEntityDescription(
+        key="filtration_swimming_remain",
+        name="Swimming Mode Remaining Time",
+        path=("state", "filtration", "swimming", "remainTime"),
+        icon="mdi:timer-sand",
+        native_unit_of_measurement="min",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_type=int,
+        bounds=(0, 10080),
+    ),
+    PoolSensorEntityDescription(
+        key="filtration_pause_remain",
+        name="Pause Remaining Time",
+        path=("state", "filtration", "pause", "remainTime"),
+        icon="mdi:timer-pause",
+        native_unit_of_measurement="min",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_type=int,
+        bounds=(0, 10080),
+    ),
+
     # Water Quality Metrics (from state.metrics)
-    {
-        "key": "water_temperature",
-        "name": "Water Temperature",
-        "path": ["state", "metrics", "waterTemperature"],
-        "device_class": "temperature",
-        "unit": UnitOfTemperature.CELSIUS,
-        "state_class": "measurement",
-    },
-    {
-        "key": "air_temperature",
-        "name": "Air Temperature",
-        "path": ["state", "metrics", "airTemperature"],
-        "device_class": "temperature",
-        "unit": UnitOfTemperature.CELSIUS,
-        "state_class": "measurement",
-    },
-    {
-        "key": "ph",
-        "name": "pH Level",
-        "path": ["state", "metrics", "ph"],
-        "icon": "mdi:ph",
-        "state_class": "measurement",
-        "attributes": {
-            "alarm_min": ["state", "metrics", "phAlarmLimits", 0],
-            "alarm_max": ["state", "metrics", "phAlarmLimits", 1],
-        },
-    },
-    {
-        "key": "orp",
-        "name": "ORP (Redox)",
-        "path": ["state", "metrics", "orp"],
-        "icon": "mdi:water-check",
-        "unit": "mV",
-        "state_class": "measurement",
-        "attributes": {
-            "alarm_min": ["state", "metrics", "orpAlarmLimits", 0],
-            "alarm_max": ["state", "metrics", "orpAlarmLimits", 1],
-        },
-    },
-    {
-        "key": "free_chlorine",
-        "name": "Free Chlorine",
-        "path": ["state", "metrics", "freeChlorine"],
-        "icon": "mdi:flask",
-        "unit": "mg/L",
-        "state_class": "measurement",
-    },
-    {
-        "key": "salinity",
-        "name": "Salinity",
-        "path": ["state", "metrics", "salinity"],
-        "icon": "mdi:shaker",
-        "unit": "g/L",
-        "state_class": "measurement",
-        "attributes": {
-            "alarm_min": ["state", "metrics", "salinityAlarmLimits", 0],
-        },
-    },
-    {
-        "key": "water_hardness",
-        "name": "Water Hardness",
-        "path": ["state", "metrics", "waterHardness"],
-        "icon": "mdi:water-opacity",
-        "unit": "°f",
-        "state_class": "measurement",
-    },
-    {
-        "key": "filter_clogging",
-        "name": "Filter Clogging",
-        "path": ["state", "metrics", "filterClogging"],
-        "icon": "mdi:air-filter",
-        "unit": PERCENTAGE,
-        "state_class": "measurement",
-    },
-]
+    PoolSensorEntityDescription(
+        key="water_temperature",
+        name="Water Temperature",
+        path=("state", "metrics", "waterTemperature"),
+        device_class=SensorDeviceClass.TEMPERATURE,
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        state_class=SensorStateClass.MEASUREMENT,
+        deadband=0.2,
+        value_type=float,
+        bounds=(-10, 60),
+    ),
+    PoolSensorEntityDescription(
+        key="air_temperature",
+        name="Air Temperature",
+        path=("state", "metrics", "airTemperature"),
+        device_class=SensorDeviceClass.TEMPERATURE,
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        state_class=SensorStateClass.MEASUREMENT,
+        deadband=0.5,
+        value_type=float,
+        bounds=(-40, 70),
+    ),
+    PoolSensorEntityDescription(
+        key="ph",
+        name="pH Level",
+        path=("state", "metrics", "ph"),
+        icon="mdi:ph",
+        state_class=SensorStateClass.MEASUREMENT,
+        deadband=0.05,
+        value_type=float,
+        bounds=(0, 14),
+        attributes=(
+            ("alarm_min", ("state", "metrics", "phAlarmLimits", 0)),
+            ("alarm_max", ("state", "metrics", "phAlarmLimits", 1)),
+        ),
+    ),
+    PoolSensorEntityDescription(
+        key="orp",
+        name="ORP (Redox)",
+        path=("state", "metrics", "orp"),
+        icon="mdi:water-check",
+        native_unit_of_measurement="mV",
+        state_class=SensorStateClass.MEASUREMENT,
+        deadband=10,
+        value_type=float,
+        bounds=(-2000, 2000),
+        attributes=(
+            ("alarm_min", ("state", "metrics", "orpAlarmLimits", 0)),
+            ("alarm_max", ("state", "metrics", "orpAlarmLimits", 1)),
+        ),
+    ),
+    PoolSensorEntityDescription(
+        key="free_chlorine",
+        name="Free Chlorine",
+        path=("state", "metrics", "freeChlorine"),
+        icon="mdi:flask",
+        native_unit_of_measurement="mg/L",
+        state_class=SensorStateClass.MEASUREMENT,
+        deadband=0.05,
+        value_type=float,
+        bounds=(0, 20),
+    ),
+    PoolSensorEntityDescription(
+        key="salinity",
+        name="Salinity",
+        path=("state", "metrics", "salinity"),
+        icon="mdi:shaker",
+        native_unit_of_measurement="g/L",
+        state_class=SensorStateClass.MEASUREMENT,
+        deadband=0.1,
+        value_type=float,
+        bounds=(0, 50),
+        attributes=(
+            ("alarm_min", ("state", "metrics", "salinityAlarmLimits", 0)),
+        ),
+        tier=TIER_SLOW,
+    ),
+    PoolSensorEntityDescription(
+        key="water_hardness",
+        name="Water Hardness",
+        path=("state", "metrics", "waterHardness"),
+        icon="mdi:water-opacity",
+        native_unit_of_measurement="°f",
+        state_class=SensorStateClass.MEASUREMENT,
+        deadband=1,
+        value_type=float,
+        bounds=(0, 200),
+        tier=TIER_SLOW,
+    ),
+    PoolSensorEntityDescription(
+        key="filter_clogging",
+        name="Filter Clogging",
+        path=("state", "metrics", "filterClogging"),
+        icon="mdi:air-filter",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        deadband=1,
+        value_type=float,
+        bounds=(0, 100),
+        tier=TIER_SLOW,
+    ),
+)
+
+
+@dataclass(frozen=True, kw_only=True)
+class DerivedSensorEntityDescription(SensorEntityDescription):
+    """Describes a sensor derived from the values of other sensors."""
+
+    # Creates the metric holding the running state of the sensor
+    metric: Callable[[], DerivedMetric]
+
+
+# Derived sensors, updated incrementally on every refresh
+DERIVED_SENSOR_DEFINITIONS: tuple[DerivedSensorEntityDescription, ...] = (
+    DerivedSensorEntityDescription(
+        key="pump_energy_rate",
+        name="Pump Energy Rate",
+        device_class=SensorDeviceClass.POWER,
+        native_unit_of_measurement=UnitOfPower.WATT,
+        state_class=SensorStateClass.MEASUREMENT,
+        metric=lambda: EwmaRate("pump_power_total", counter=True),
+    ),
+    DerivedSensorEntityDescription(
+        key="chlorine_consumption_rate",
+        name="Chlorine Consumption Rate",
+        icon="mdi:flask-minus",
+        native_unit_of_measurement="mg/L/h",
+        state_class=SensorStateClass.MEASUREMENT,
+        metric=lambda: EwmaRate("free_chlorine", scale=-1),
+    ),
+    DerivedSensorEntityDescription(
+        key="ph_drift",
+        name="pH Drift",
+        icon="mdi:ph",
+        native_unit_of_measurement="pH/h",
+        state_class=SensorStateClass.MEASUREMENT,
+        metric=lambda: EwmaRate("ph"),
+    ),
+    DerivedSensorEntityDescription(
+        key="water_temperature_trend",
+        name="Water Temperature Trend",
+        icon="mdi:thermometer-lines",
+        native_unit_of_measurement="°C/h",
+        state_class=SensorStateClass.MEASUREMENT,
+        metric=lambda: EwmaRate("water_temperature"),
+    ),
+    DerivedSensorEntityDescription(
+        key="filtration_hours_today",
+        name="Filtration Hours Today",
+        icon="mdi:filter",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.HOURS,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        metric=lambda: DailyDuration("pump_state"),
+    ),
+    DerivedSensorEntityDescription(
+        key="ph_time_to_alarm",
+        name="pH Time to Alarm",
+        icon="mdi:alarm",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.HOURS,
+        metric=lambda: TimeToAlarm("ph"),
+    ),
+    DerivedSensorEntityDescription(
+        key="orp_time_to_alarm",
+        name="ORP Time to Alarm",
+        icon="mdi:alarm",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.HOURS,
+        metric=lambda: TimeToAlarm("orp"),
+    ),
+)
+
+
+# Alarm rules on the limits set on the controller, a flip must last for
+# the delay and the hysteresis keeps a value on the limit from flapping
+ALARM_RULES: tuple[AlarmRule, ...] = (
+    AlarmRule(
+        key="ph_alarm",
+        name="pH Alarm",
+        source="ph",
+        above=("ph", "alarm_max"),
+        below=("ph", "alarm_min"),
+        hysteresis=0.05,
+        delay=60,
+    ),
+    AlarmRule(
+        key="orp_alarm",
+        name="ORP Alarm",
+        source="orp",
+        above=("orp", "alarm_max"),
+        below=("orp", "alarm_min"),
+        hysteresis=10,
+        delay=60,
+    ),
+    AlarmRule(
+        key="salinity_alarm",
+        name="Salinity Alarm",
+        source="salinity",
+        below=("salinity", "alarm_min"),
+        hysteresis=0.1,
+        delay=60,
+    ),
+)
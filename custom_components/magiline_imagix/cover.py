@@ -0,0 +1,103 @@
+"""Support for Pool Monitor covers."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.cover import (
+    ATTR_POSITION,
+    CoverEntity,
+    CoverEntityFeature,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from . import PoolDataUpdateCoordinator
+from .const import DOMAIN, ROLLER_STATE_CLOSING, ROLLER_STATE_OPENING
+from .entity import PoolEntity
+
+ROLLER_POSITION_PATH = ("state", "roller", "position")
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up Pool Monitor covers from a config entry."""
+    coordinator: PoolDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    # Controls need the command endpoint to be configured
+    if coordinator.writer is None:
+        return
+
+    async_add_entities([PoolRollerCover(coordinator=coordinator, entry=entry)])
+
+
+class PoolRollerCover(PoolEntity, CoverEntity):
+    """Cover moving the pool roller shutter."""
+
+    _attr_name = "Pool Cover"
+    _attr_icon = "mdi:window-shutter"
+    _attr_supported_features = (
+        CoverEntityFeature.OPEN
+        | CoverEntityFeature.CLOSE
+        | CoverEntityFeature.SET_POSITION
+    )
+
+    def __init__(
+        self,
+        coordinator: PoolDataUpdateCoordinator,
+        entry: ConfigEntry,
+    ) -> None:
+        """Initialize the cover."""
+        super().__init__(coordinator, entry, "roller")
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        # Follows the changes of the pool cover position and state sensors
+        if not self.coordinator.changed_sensors.isdisjoint(
+            ("roller_position", "roller_state")
+        ):
+            self.async_write_ha_state()
+
+    @property
+    def current_cover_position(self) -> int | None:
+        """Return the position of the cover, 0 is closed."""
+        return self.coordinator.snapshot.get("roller_position")
+
+    @property
+    def is_opening(self) -> bool | None:
+        """Return if the cover is opening."""
+        if (state := self.coordinator.snapshot.get("roller_state")) is None:
+            return None
+        return state == ROLLER_STATE_OPENING
+
+    @property
+    def is_closing(self) -> bool | None:
+        """Return if the cover is closing."""
+        if (state := self.coordinator.snapshot.get("roller_state")) is None:
+            return None
+        return state == ROLLER_STATE_CLOSING
+
+    @property
+    def is_closed(self) -> bool | None:
+        """Return if the cover is closed."""
+        if (position := self.current_cover_position) is None:
+            return None
+        return position == 0
+
+    async def async_open_cover(self, **kwargs: Any) -> None:
+        """Open the cover."""
+        await self.coordinator.writer.async_set(ROLLER_POSITION_PATH, 100)
+
+    async def async_close_cover(self, **kwargs: Any) -> None:
+        """Close the cover."""
+        await self.coordinator.writer.async_set(ROLLER_POSITION_PATH, 0)
+
+    async def async_set_cover_position(self, **kwargs: Any) -> None:
+        """Move the cover to a position."""
+        await self.coordinator.writer.async_set(
+            ROLLER_POSITION_PATH, kwargs[ATTR_POSITION]
+        )
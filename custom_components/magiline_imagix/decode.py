@@ -0,0 +1,41 @@
+"""Reading and decoding of the pool info payload."""
+from __future__ import annotations
+
+import json
+from typing import Any
+
+import aiohttp
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson ships with Home Assistant
+    orjson = None
+
+CHUNK_SIZE = 16 * 1024
+
+
+class PayloadTooLarge(ValueError):
+    """Error to indicate the controller sent more data than allowed."""
+
+
+async def async_read_body(response: aiohttp.ClientResponse, max_size: int) -> bytes:
+    """Read the raw response body, refusing bodies over max_size bytes."""
+    if response.content_length is not None and response.content_length > max_size:
+        raise PayloadTooLarge(
+            f"Payload of {response.content_length} bytes exceeds {max_size}"
+        )
+
+    body = bytearray()
+    async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+        body += chunk
+        if len(body) > max_size:
+            raise PayloadTooLarge(f"Payload exceeds {max_size} bytes")
+
+    return bytes(body)
+
+
+def decode_payload(body: bytes) -> Any:
+    """Decode a raw JSON body, using orjson when it is available."""
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
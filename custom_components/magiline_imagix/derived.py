@@ -0,0 +1,166 @@
+"""Metrics derived incrementally from the sensor snapshot.
+
+Each metric keeps a few running values updated in constant time on every
+successful refresh, so nothing is recomputed over the recorder history.
+Their state is a plain dict so it can be persisted with the cached payload.
+"""
+from __future__ import annotations
+
+from collections.abc import Hashable, Mapping
+from datetime import datetime
+import math
+from typing import Any
+
+# Time constant of the rate averages
+DERIVED_HALF_LIFE = 1800  # seconds
+
+# Gaps longer than this between refreshes are not accumulated
+DERIVED_MAX_GAP = 900  # seconds
+
+# Projections further away than this are not reported
+TIME_TO_ALARM_HORIZON = 7 * 24  # hours
+
+
+def _number(value: Any) -> float | None:
+    """Return a snapshot value as a float, if it is a number."""
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    return float(value)
+
+
+class DerivedMetric:
+    """Base of the metrics derived from a sensor of the snapshot."""
+
+    # Attributes holding the running state
+    _STATE: tuple[str, ...] = ()
+
+    def __init__(self, source: str) -> None:
+        """Initialize the metric."""
+        self.source = source
+
+    @property
+    def value(self) -> float | None:
+        """Return the current value of the metric."""
+        raise NotImplementedError
+
+    def update(self, now: datetime, snapshot: Mapping[Hashable, Any]) -> None:
+        """Take the values of a new snapshot into account."""
+        raise NotImplementedError
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the running state to persist."""
+        return {name: getattr(self, name) for name in self._STATE}
+
+    def restore(self, data: Mapping[str, Any]) -> None:
+        """Restore a persisted running state."""
+        for name in self._STATE:
+            if name in data:
+                setattr(self, name, data[name])
+
+
+class EwmaRate(DerivedMetric):
+    """Exponentially weighted rate of change of a value, per hour.
+
+    Counters, such as energy totals, ignore the samples where they reset.
+    """
+
+    _STATE = ("rate", "last_value", "last_time")
+
+    def __init__(self, source: str, scale: float = 1.0, counter: bool = False) -> None:
+        """Initialize the metric."""
+        super().__init__(source)
+        self.scale = scale
+        self.counter = counter
+        self.rate: float | None = None
+        self.last_value: float | None = None
+        self.last_time: float | None = None
+
+    @property
+    def value(self) -> float | None:
+        """Return the rate per hour."""
+        return None if self.rate is None else round(self.rate * self.scale, 3)
+
+    def update(self, now: datetime, snapshot: Mapping[Hashable, Any]) -> None:
+        """Fold the change since the previous sample into the average."""
+        if (value := _number(snapshot.get(self.source))) is None:
+            return
+
+        when = now.timestamp()
+        if self.last_value is not None and self.last_time is not None:
+            elapsed = when - self.last_time
+            if elapsed <= 0:
+                return
+            if elapsed <= DERIVED_MAX_GAP and not (
+                self.counter and value < self.last_value
+            ):
+                rate = (value - self.last_value) / elapsed * 3600
+                if self.rate is None:
+                    self.rate = rate
+                else:
+                    alpha = 1 - math.exp(-elapsed * math.log(2) / DERIVED_HALF_LIFE)
+                    self.rate += alpha * (rate - self.rate)
+
+        self.last_value = value
+        self.last_time = when
+
+
+class DailyDuration(DerivedMetric):
+    """Hours a sensor was on since local midnight."""
+
+    _STATE = ("day", "seconds", "running", "last_time")
+
+    def __init__(self, source: str) -> None:
+        """Initialize the metric."""
+        super().__init__(source)
+        self.day: str | None = None
+        self.seconds = 0.0
+        self.running = False
+        self.last_time: float | None = None
+
+    @property
+    def value(self) -> float | None:
+        """Return the hours on today."""
+        return None if self.day is None else round(self.seconds / 3600, 2)
+
+    def update(self, now: datetime, snapshot: Mapping[Hashable, Any]) -> None:
+        """Add the time since the previous sample if the sensor was on."""
+        when = now.timestamp()
+        if (day := now.date().isoformat()) != self.day:
+            self.day = day
+            self.seconds = 0.0
+        elif self.running and self.last_time is not None:
+            if 0 < (elapsed := when - self.last_time) <= DERIVED_MAX_GAP:
+                self.seconds += elapsed
+
+        self.running = bool(snapshot.get(self.source))
+        self.last_time = when
+
+
+class TimeToAlarm(EwmaRate):
+    """Hours until a value reaches its alarm limits at its current rate."""
+
+    def __init__(self, source: str) -> None:
+        """Initialize the metric."""
+        super().__init__(source)
+        self.alarm_min: float | None = None
+        self.alarm_max: float | None = None
+
+    @property
+    def value(self) -> float | None:
+        """Return the projected hours, None when not heading to a limit."""
+        if self.rate is None or self.last_value is None or not self.rate:
+            return None
+
+        limit = self.alarm_max if self.rate > 0 else self.alarm_min
+        if limit is None:
+            return None
+        hours = (limit - self.last_value) / self.rate
+        if hours > TIME_TO_ALARM_HORIZON:
+            return None
+        return round(max(hours, 0.0), 1)
+
+    def update(self, now: datetime, snapshot: Mapping[Hashable, Any]) -> None:
+        """Track the value, its rate and its alarm limits."""
+        super().update(now, snapshot)
+        self.alarm_min = _number(snapshot.get((self.source, "alarm_min")))
+        self.alarm_max = _number(snapshot.get((self.source, "alarm_max")))
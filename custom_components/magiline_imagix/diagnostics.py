@@ -0,0 +1,70 @@
+"""Diagnostics support for the Pool Monitor integration."""
+from __future__ import annotations
+
+from dataclasses import asdict
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_HOST, CONF_WEBHOOK_ID
+from homeassistant.core import HomeAssistant
+
+from . import PoolDataUpdateCoordinator
+from .const import DOMAIN
+
+TO_REDACT = {CONF_HOST, CONF_WEBHOOK_ID}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: PoolDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    hub_stats = coordinator.hub.stats.get(entry.entry_id)
+
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": async_redact_data(dict(entry.options), TO_REDACT),
+        },
+        "coordinator": {
+            "last_update_success": coordinator.last_update_success,
+            "poll_interval": coordinator.poll_interval.total_seconds(),
+            "state_writes": coordinator.state_writes,
+            "skipped_writes": coordinator.skipped_writes,
+            "cache_hits": coordinator.cache_hits,
+            "cache_misses": coordinator.cache_misses,
+            "push_updates": coordinator.push_updates,
+            "coalesced_refreshes": coordinator.coalesced_refreshes,
+            "schema_violations": coordinator.schema_violations,
+            "dropped_frames": coordinator.dropped_frames,
+            "commands_sent": (
+                coordinator.writer.commands_sent if coordinator.writer else None
+            ),
+            "breaker_open": coordinator.breaker.is_open,
+            "breaker_failures": coordinator.breaker.failures,
+            "stale": coordinator.stale,
+            "buffered_samples": {
+                key: len(publisher.buffer)
+                for key, publisher in coordinator.publishers.items()
+            },
+        },
+        "endpoints": [
+            {
+                "path": endpoint.path,
+                "interval": endpoint.interval,
+                "tiers": sorted(endpoint.tiers),
+            }
+            for endpoint in coordinator.endpoints
+        ],
+        "hub": asdict(hub_stats) if hub_stats is not None else None,
+        "refresh": coordinator.stats.as_dict(),
+        "derived": {
+            key: metric.as_dict() for key, metric in coordinator.derived.items()
+        },
+        "alarms": {
+            rule.key: coordinator.alarms.is_active(rule.key)
+            for rule in coordinator.alarms.rules
+        },
+        "data": coordinator.data,
+    }
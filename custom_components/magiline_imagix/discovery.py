@@ -0,0 +1,128 @@
+"""Discovery of pool controllers on the local networks."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable
+from dataclasses import dataclass
+from ipaddress import IPv4Network, ip_interface
+import logging
+import time
+
+import aiohttp
+import async_timeout
+
+from homeassistant.components import network
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from .const import (
+    DEFAULT_PATH,
+    DISCOVERY_CONCURRENCY,
+    DISCOVERY_CONNECT_TIMEOUT,
+    DISCOVERY_PORT,
+    DISCOVERY_READ_TIMEOUT,
+    MAX_PAYLOAD_SIZE,
+)
+from .decode import async_read_body, decode_payload
+
+_LOGGER = logging.getLogger(__name__)
+
+# Larger networks are only scanned around the address of Home Assistant
+MIN_PREFIX_LENGTH = 24
+
+
+@dataclass(frozen=True, slots=True)
+class DiscoveredController:
+    """A host answering like a pool controller."""
+
+    host: str  # address:port, as entered in the config flow
+    latency: float  # seconds to fetch the payload
+    has_state: bool  # the payload holds the state the sensors read
+
+
+async def _async_probe(
+    session: aiohttp.ClientSession,
+    address: str,
+    port: int,
+    path: str,
+) -> DiscoveredController | None:
+    """Return the controller at an address, if one answers there."""
+    # A bare connect first, most addresses of a network have nothing there
+    try:
+        async with async_timeout.timeout(DISCOVERY_CONNECT_TIMEOUT):
+            _, writer = await asyncio.open_connection(address, port)
+    except (OSError, asyncio.TimeoutError):
+        return None
+    writer.close()
+
+    start = time.perf_counter()
+    try:
+        async with (
+            async_timeout.timeout(DISCOVERY_READ_TIMEOUT),
+            session.get(f"http://{address}:{port}{path}") as response,
+        ):
+            if response.status != 200:
+                return None
+            data = decode_payload(await async_read_body(response, MAX_PAYLOAD_SIZE))
+    except (aiohttp.ClientError, asyncio.TimeoutError, ValueError):
+        return None
+
+    return DiscoveredController(
+        host=f"{address}:{port}",
+        latency=time.perf_counter() - start,
+        has_state=isinstance(data, dict) and isinstance(data.get("state"), dict),
+    )
+
+
+async def async_scan(
+    session: aiohttp.ClientSession,
+    targets: Iterable[tuple[str, int]],
+    path: str = DEFAULT_PATH,
+    concurrency: int = DISCOVERY_CONCURRENCY,
+) -> list[DiscoveredController]:
+    """Probe addresses and ports concurrently for pool controllers.
+
+    The controllers found are ranked, those whose payload holds the pool
+    state first, then by how fast they answered.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _async_bounded_probe(
+        address: str, port: int
+    ) -> DiscoveredController | None:
+        async with semaphore:
+            return await _async_probe(session, address, port, path)
+
+    results = await asyncio.gather(
+        *(_async_bounded_probe(address, port) for address, port in targets)
+    )
+    return sorted(
+        (result for result in results if result is not None),
+        key=lambda result: (not result.has_state, result.latency),
+    )
+
+
+async def async_local_networks(hass: HomeAssistant) -> list[IPv4Network]:
+    """Return the IPv4 networks of the enabled network adapters."""
+    networks: dict[IPv4Network, None] = {}
+    for adapter in await network.async_get_adapters(hass):
+        if not adapter["enabled"]:
+            continue
+        for ipv4 in adapter["ipv4"]:
+            interface = ip_interface(
+                f"{ipv4['address']}/{max(ipv4['network_prefix'], MIN_PREFIX_LENGTH)}"
+            )
+            if not interface.is_loopback:
+                networks[interface.network] = None
+    return list(networks)
+
+
+async def async_discover(hass: HomeAssistant) -> list[DiscoveredController]:
+    """Return the pool controllers found on the local networks."""
+    targets = [
+        (str(address), DISCOVERY_PORT)
+        for local_network in await async_local_networks(hass)
+        for address in local_network.hosts()
+    ]
+    _LOGGER.debug("Scanning %s addresses for pool controllers", len(targets))
+    return await async_scan(async_get_clientsession(hass), targets)
@@ -0,0 +1,92 @@
+"""Endpoints fetched by the coordinator and the tiers of data they serve.
+
+Each tier of sensors is read from an endpoint refreshed at its own rate.
+Tiers configured with the same path share one endpoint, refreshed at the
+fastest of their rates, so a single endpoint controller is fetched once.
+"""
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+TIER_FAST = "fast"
+TIER_SLOW = "slow"
+
+
+@dataclass(frozen=True, slots=True)
+class EndpointPayload:
+    """A changed payload of an endpoint, stored once it was processed."""
+
+    data: Any
+    digest: bytes
+    etag: str | None = None
+    last_modified: str | None = None
+
+
+@dataclass(slots=True)
+class Endpoint:
+    """An endpoint of the controller and its change detection state."""
+
+    path: str
+    interval: float  # seconds between fetches, 0 fetches on every poll
+    tiers: set[str] = field(default_factory=set)
+    etag: str | None = None
+    last_modified: str | None = None
+    digest: bytes | None = None
+    data: Any = None
+    fetched_at: float | None = None  # loop time
+
+    def is_due(self, now: float) -> bool:
+        """Return whether the endpoint should be fetched."""
+        return self.fetched_at is None or now - self.fetched_at >= self.interval
+
+    def store(self, payload: EndpointPayload, now: float) -> None:
+        """Keep a processed payload and its change detection state."""
+        self.data = payload.data
+        self.digest = payload.digest
+        self.etag = payload.etag
+        self.last_modified = payload.last_modified
+        self.fetched_at = now
+
+    def invalidate(self) -> None:
+        """Forget the change detection state to process the next payload."""
+        self.etag = self.last_modified = self.digest = None
+
+
+def build_endpoints(tiers: Mapping[str, tuple[str, float]]) -> list[Endpoint]:
+    """Return the endpoints serving tiers given as path and interval.
+
+    The slowest endpoints come first, so merging their payloads in order
+    lets the fresher ones win.
+    """
+    endpoints: dict[str, Endpoint] = {}
+    for tier, (path, interval) in tiers.items():
+        if (endpoint := endpoints.get(path)) is None:
+            endpoint = endpoints[path] = Endpoint(path, interval)
+        endpoint.interval = min(endpoint.interval, interval)
+        endpoint.tiers.add(tier)
+    return sorted(endpoints.values(), key=lambda endpoint: -endpoint.interval)
+
+
+def _merge(target: dict[str, Any], payload: Mapping[str, Any]) -> None:
+    """Deep merge a payload into another, copying only the merged dicts."""
+    for key, value in payload.items():
+        if isinstance(value, Mapping) and isinstance(target.get(key), dict):
+            target[key] = dict(target[key])
+            _merge(target[key], value)
+        else:
+            target[key] = value
+
+
+def merge_payloads(payloads: Iterable[Any]) -> Any:
+    """Return the payloads of several endpoints merged into one."""
+    payloads = [payload for payload in payloads if payload is not None]
+    if len(payloads) == 1:
+        return payloads[0]
+
+    merged: dict[str, Any] = {}
+    for payload in payloads:
+        if isinstance(payload, Mapping):
+            _merge(merged, payload)
+    return merged
@@ -0,0 +1,43 @@
+"""Base entity of the Pool Monitor integration."""
+from __future__ import annotations
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from . import PoolDataUpdateCoordinator
+
+
+class PoolEntity(CoordinatorEntity):
+    """Entity of a pool, grouped under the device of its controller."""
+
+    _attr_has_entity_name = True
+    coordinator: PoolDataUpdateCoordinator
+
+    def __init__(
+        self,
+        coordinator: PoolDataUpdateCoordinator,
+        entry: ConfigEntry,
+        key: str,
+    ) -> None:
+        """Initialize the entity."""
+        super().__init__(coordinator)
+
+        self.key = key
+        self._attr_unique_id = f"{entry.entry_id}_{key}"
+        # Device info shared by all entities of the pool
+        self._attr_device_info = coordinator.device_info
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        # Skip identical states to spare the recorder and the event bus
+        if self.coordinator.async_should_write(self.key):
+            self.async_write_ha_state()
+
+    @property
+    def available(self) -> bool:
+        """Return if entity is available."""
+        # Available if we have data, even if an update failed, until
+        # nothing was fetched for several poll intervals
+        return self.coordinator.data is not None and not self.coordinator.stale
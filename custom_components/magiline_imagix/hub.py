@@ -0,0 +1,162 @@
+"""Shared poll scheduling for all pool controllers."""
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+import logging
+from typing import TYPE_CHECKING
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+
+from .const import (
+    DOMAIN,
+    HUB_MAX_CONCURRENT_POLLS,
+    HUB_STAGGER_RATIO,
+    HUB_TICK_INTERVAL,
+)
+
+if TYPE_CHECKING:
+    from . import PoolDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_HUB = f"{DOMAIN}_hub"
+
+
+@dataclass
+class PoolStats:
+    """Poll statistics of one pool controller."""
+
+    polls: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+    last_latency: float | None = None
+    total_latency: float = 0.0
+
+    @property
+    def mean_latency(self) -> float | None:
+        """Return the mean poll latency in seconds."""
+        return self.total_latency / self.polls if self.polls else None
+
+
+@dataclass
+class _PoolSchedule:
+    """Scheduling state of one pool controller."""
+
+    coordinator: PoolDataUpdateCoordinator
+    stats: PoolStats
+    phase: float  # fraction of the poll interval
+    next_poll: float = float("inf")
+    in_flight: bool = False
+
+
+@callback
+def async_get_hub(hass: HomeAssistant) -> PoolHub:
+    """Return the hub shared by all config entries, creating it if needed."""
+    if DATA_HUB not in hass.data:
+        hass.data[DATA_HUB] = PoolHub(hass)
+    return hass.data[DATA_HUB]
+
+
+class PoolHub:
+    """Poll every pool controller from a single timer.
+
+    Polls are staggered so controllers set up together do not fire at
+    the same moment, and the number of requests in flight is capped.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the hub."""
+        self.hass = hass
+        self.semaphore = asyncio.Semaphore(HUB_MAX_CONCURRENT_POLLS)
+        self._pools: dict[str, _PoolSchedule] = {}
+        self._slot = 0
+        self._unsub_tick: CALLBACK_TYPE | None = None
+
+    @property
+    def stats(self) -> dict[str, PoolStats]:
+        """Return the poll statistics of every pool by config entry ID."""
+        return {entry_id: pool.stats for entry_id, pool in self._pools.items()}
+
+    @callback
+    def async_register(self, coordinator: PoolDataUpdateCoordinator) -> CALLBACK_TYPE:
+        """Start scheduling the polls of a coordinator."""
+        entry_id = coordinator.config_entry.entry_id
+        self._pools[entry_id] = _PoolSchedule(
+            coordinator=coordinator,
+            stats=PoolStats(),
+            phase=self._slot * HUB_STAGGER_RATIO % 1,
+        )
+        self._slot += 1
+
+        if self._unsub_tick is None:
+            self._unsub_tick = async_track_time_interval(
+                self.hass,
+                self._async_tick,
+                timedelta(seconds=HUB_TICK_INTERVAL),
+                name=f"{DOMAIN} hub",
+            )
+
+        @callback
+        def _async_unregister() -> None:
+            self._pools.pop(entry_id, None)
+            if not self._pools:
+                if self._unsub_tick is not None:
+                    self._unsub_tick()
+                self.hass.data.pop(DATA_HUB, None)
+
+        return _async_unregister
+
+    @callback
+    def async_record_poll(
+        self, coordinator: PoolDataUpdateCoordinator, latency: float, success: bool
+    ) -> None:
+        """Record a finished poll and schedule the next one."""
+        if (pool := self._pools.get(coordinator.config_entry.entry_id)) is None:
+            return
+
+        stats = pool.stats
+        stats.polls += 1
+        stats.last_latency = latency
+        stats.total_latency += latency
+        if success:
+            stats.consecutive_failures = 0
+        else:
+            stats.failures += 1
+            stats.consecutive_failures += 1
+
+        self.async_reschedule(coordinator)
+
+    @callback
+    def async_reschedule(self, coordinator: PoolDataUpdateCoordinator) -> None:
+        """Schedule the next poll of a coordinator one interval from now."""
+        if (pool := self._pools.get(coordinator.config_entry.entry_id)) is None:
+            return
+
+        # The stagger phase only offsets the first scheduled poll
+        interval = coordinator.poll_interval.total_seconds()
+        pool.next_poll = self.hass.loop.time() + interval * (1 + pool.phase)
+        pool.phase = 0
+
+    @callback
+    def _async_tick(self, now: datetime) -> None:
+        """Start the polls that are due."""
+        loop_time = self.hass.loop.time()
+        for entry_id, pool in self._pools.items():
+            if pool.in_flight or pool.next_poll > loop_time:
+                continue
+
+            pool.in_flight = True
+            task = pool.coordinator.config_entry.async_create_background_task(
+                self.hass,
+                pool.coordinator.async_refresh(),
+                f"{DOMAIN} poll {entry_id}",
+            )
+            task.add_done_callback(lambda _, pool=pool: self._async_poll_done(pool))
+
+    @callback
+    def _async_poll_done(self, pool: _PoolSchedule) -> None:
+        """Allow the next poll of a pool to start."""
+        pool.in_flight = False
@@ -0,0 +1,106 @@
+"""Timing instrumentation of the coordinator refreshes."""
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import asdict, dataclass
+import time
+from types import SimpleNamespace
+from typing import Any
+
+import aiohttp
+
+from .const import STATS_HISTOGRAM_BUCKETS, STATS_WINDOW
+
+
+@dataclass(slots=True)
+class RefreshTiming:
+    """Timings of one refresh, in seconds."""
+
+    connect: float | None = None  # None when a kept-alive connection was reused
+    ttfb: float | None = None
+    body_read: float | None = None
+    decode: float | None = None
+    dispatch: float | None = None
+    total: float | None = None
+    payload_size: int | None = None
+    error: str | None = None
+
+
+# Timing fields summarized in histograms
+_DURATIONS = ("connect", "ttfb", "body_read", "decode", "dispatch", "total")
+
+
+class RefreshStats:
+    """Rolling window of refresh timings."""
+
+    def __init__(self, window: int = STATS_WINDOW) -> None:
+        """Initialize the window."""
+        self.timings: deque[RefreshTiming] = deque(maxlen=window)
+        self.refreshes = 0
+        self.errors = 0
+
+    @property
+    def last(self) -> RefreshTiming | None:
+        """Return the timings of the latest refresh."""
+        return self.timings[-1] if self.timings else None
+
+    def record(self, timing: RefreshTiming) -> None:
+        """Add the timings of a finished refresh."""
+        self.timings.append(timing)
+        self.refreshes += 1
+        if timing.error is not None:
+            self.errors += 1
+
+    def histogram(self, name: str) -> dict[str, int]:
+        """Return the histogram of a duration over the window, in ms buckets."""
+        counts = dict.fromkeys((f"<={bucket}" for bucket in STATS_HISTOGRAM_BUCKETS), 0)
+        counts["inf"] = 0
+        for timing in self.timings:
+            if (value := getattr(timing, name)) is None:
+                continue
+            for bucket in STATS_HISTOGRAM_BUCKETS:
+                if value * 1000 <= bucket:
+                    counts[f"<={bucket}"] += 1
+                    break
+            else:
+                counts["inf"] += 1
+        return counts
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics for diagnostics."""
+        return {
+            "refreshes": self.refreshes,
+            "errors": self.errors,
+            "window": [asdict(timing) for timing in self.timings],
+            "histograms_ms": {name: self.histogram(name) for name in _DURATIONS},
+        }
+
+
+async def _on_connection_create_start(
+    session: aiohttp.ClientSession,
+    context: SimpleNamespace,
+    params: aiohttp.TraceConnectionCreateStartParams,
+) -> None:
+    """Note when a new connection starts being opened."""
+    context.connect_start = time.perf_counter()
+
+
+async def _on_connection_create_end(
+    session: aiohttp.ClientSession,
+    context: SimpleNamespace,
+    params: aiohttp.TraceConnectionCreateEndParams,
+) -> None:
+    """Store the time taken to open a new connection."""
+    if isinstance(timing := context.trace_request_ctx, RefreshTiming):
+        timing.connect = time.perf_counter() - context.connect_start
+
+
+def create_trace_config() -> aiohttp.TraceConfig:
+    """Return a trace config timing connections into a RefreshTiming.
+
+    The timing is passed per request as ``trace_request_ctx``.
+    """
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_connection_create_start.append(_on_connection_create_start)
+    trace_config.on_connection_create_end.append(_on_connection_create_end)
+    return trace_config
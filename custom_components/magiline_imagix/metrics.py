@@ -0,0 +1,258 @@
+"""OpenMetrics export of the values and fetch statistics of every pool.
+
+The samples of a pool are rendered after its coordinator updates or
+finishes a refresh, and the body is assembled from them once until the
+next one, so scrapes only serve cached bytes.
+"""
+from __future__ import annotations
+
+from collections.abc import Callable
+from functools import partial
+from typing import TYPE_CHECKING
+
+from aiohttp import web
+
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from . import PoolDataUpdateCoordinator
+
+DATA_EXPORTER = f"{DOMAIN}_metrics"
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+_PREFIX = DOMAIN
+
+
+# Fetch statistics of the coordinators: name, type, help and reader
+_FETCH_FAMILIES: tuple[
+    tuple[str, str, str, Callable[[PoolDataUpdateCoordinator], float | None]], ...
+] = (
+    (
+        "up",
+        "gauge",
+        "Whether the controller answers and the data is fresh",
+        lambda coordinator: int(not coordinator.breaker.is_open and not coordinator.stale),
+    ),
+    (
+        "refreshes",
+        "counter",
+        "Refreshes of the pool data",
+        lambda coordinator: coordinator.stats.refreshes,
+    ),
+    (
+        "refresh_errors",
+        "counter",
+        "Refreshes that failed",
+        lambda coordinator: coordinator.stats.errors,
+    ),
+    (
+        "refresh_duration_seconds",
+        "gauge",
+        "Duration of the last refresh",
+        lambda coordinator: (
+            coordinator.stats.last.total if coordinator.stats.last is not None else None
+        ),
+    ),
+    (
+        "payload_changes",
+        "counter",
+        "Fetched or pushed payloads that changed",
+        lambda coordinator: coordinator.cache_misses,
+    ),
+    (
+        "payload_unchanged",
+        "counter",
+        "Fetched or pushed payloads that did not change",
+        lambda coordinator: coordinator.cache_hits,
+    ),
+    (
+        "push_updates",
+        "counter",
+        "Payloads pushed by the controller",
+        lambda coordinator: coordinator.push_updates,
+    ),
+    (
+        "coalesced_refreshes",
+        "counter",
+        "Refreshes served by a fetch already made",
+        lambda coordinator: coordinator.coalesced_refreshes,
+    ),
+    (
+        "schema_violations",
+        "counter",
+        "Values dropped by the schema",
+        lambda coordinator: coordinator.schema_violations,
+    ),
+    (
+        "dropped_frames",
+        "counter",
+        "Payloads dropped as corrupt",
+        lambda coordinator: coordinator.dropped_frames,
+    ),
+    (
+        "last_fetch_timestamp_seconds",
+        "gauge",
+        "Time of the last successful fetch",
+        lambda coordinator: (
+            coordinator.fetched_at.timestamp()
+            if coordinator.fetched_at is not None
+            else None
+        ),
+    ),
+)
+
+_SENSOR_FAMILY = ("sensor", "gauge", "Value of a pool sensor")
+
+
+def _escape(value: str) -> str:
+    """Escape a label value."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _sample(name: str, labels: str, value: float) -> str:
+    """Return a sample line."""
+    return f"{name}{{{labels}}} {value!r}\n"
+
+
+class _PoolSamples:
+    """Rendered samples of one pool, by family."""
+
+    __slots__ = ("coordinator", "labels", "families", "generation", "sensor_samples")
+
+    def __init__(self, coordinator: PoolDataUpdateCoordinator) -> None:
+        """Initialize the samples."""
+        self.coordinator = coordinator
+        self.labels = (
+            f'entry_id="{_escape(coordinator.config_entry.entry_id)}",'
+            f'host="{_escape(coordinator.host)}"'
+        )
+        self.families: dict[str, str] | None = None
+        # The sensor samples only change with the snapshot
+        self.generation: int | None = None
+        self.sensor_samples = ""
+
+    def render(self) -> dict[str, str]:
+        """Return the samples by family, rendering them if the pool updated."""
+        if self.families is not None:
+            return self.families
+
+        coordinator = self.coordinator
+        families = {}
+        for name, kind, _, read in _FETCH_FAMILIES:
+            if (value := read(coordinator)) is None:
+                continue
+            # Counter samples carry the _total suffix of OpenMetrics
+            suffix = "_total" if kind == "counter" else ""
+            families[name] = _sample(f"{_PREFIX}_{name}{suffix}", self.labels, value)
+
+        if coordinator.generation != self.generation:
+            self.generation = coordinator.generation
+            self.sensor_samples = "".join(
+                _sample(
+                    f"{_PREFIX}_sensor",
+                    f'{self.labels},sensor="{description.key}"',
+                    float(value),
+                )
+                for description in coordinator.descriptions
+                if isinstance(
+                    value := coordinator.snapshot.get(description.key), (int, float)
+                )
+            )
+        families[_SENSOR_FAMILY[0]] = self.sensor_samples
+
+        self.families = families
+        return families
+
+
+@callback
+def async_get_exporter(hass: HomeAssistant) -> MetricsExporter:
+    """Return the exporter shared by all config entries, creating it if needed."""
+    if DATA_EXPORTER not in hass.data:
+        exporter = hass.data[DATA_EXPORTER] = MetricsExporter()
+        # Views cannot be removed, an exporter without pools serves no samples
+        hass.http.register_view(PoolMetricsView(exporter))
+    return hass.data[DATA_EXPORTER]
+
+
+class MetricsExporter:
+    """Cache the OpenMetrics body of the pools exporting their metrics."""
+
+    def __init__(self) -> None:
+        """Initialize the exporter."""
+        self._pools: dict[str, _PoolSamples] = {}
+        self._body: bytes | None = None
+        self.renders = 0
+
+    @callback
+    def async_register(self, coordinator: PoolDataUpdateCoordinator) -> CALLBACK_TYPE:
+        """Start exporting the metrics of a coordinator."""
+        entry_id = coordinator.config_entry.entry_id
+        self._pools[entry_id] = _PoolSamples(coordinator)
+        self._body = None
+        # Listeners follow pushed payloads and commands, refresh listeners
+        # follow the failed polls the listeners are not told about
+        invalidate = partial(self._async_invalidate, entry_id)
+        unsubs = (
+            coordinator.async_add_listener(invalidate),
+            coordinator.async_add_refresh_listener(invalidate),
+        )
+
+        @callback
+        def _async_unregister() -> None:
+            for unsub in unsubs:
+                unsub()
+            self._pools.pop(entry_id, None)
+            self._body = None
+
+        return _async_unregister
+
+    @callback
+    def _async_invalidate(self, entry_id: str) -> None:
+        """Render the samples of a pool again at the next scrape."""
+        self._pools[entry_id].families = None
+        self._body = None
+
+    @callback
+    def async_render(self) -> bytes:
+        """Return the body, rendering it if a pool updated since the last scrape."""
+        if self._body is not None:
+            return self._body
+
+        # The samples of a family are grouped across the pools
+        pools = [pool.render() for pool in self._pools.values()]
+        lines = []
+        for name, kind, help_text in (
+            *(family[:3] for family in _FETCH_FAMILIES),
+            _SENSOR_FAMILY,
+        ):
+            family = f"{_PREFIX}_{name}"
+            lines.append(f"# TYPE {family} {kind}\n# HELP {family} {help_text}.\n")
+            lines.extend(families.get(name, "") for families in pools)
+        lines.append("# EOF\n")
+
+        self._body = "".join(lines).encode()
+        self.renders += 1
+        return self._body
+
+
+class PoolMetricsView(HomeAssistantView):
+    """Serve the metrics of the pools in OpenMetrics text format."""
+
+    url = f"/api/{DOMAIN}/metrics"
+    name = f"api:{DOMAIN}:metrics"
+
+    def __init__(self, exporter: MetricsExporter) -> None:
+        """Initialize the view."""
+        self.exporter = exporter
+
+    @callback
+    def get(self, request: web.Request) -> web.Response:
+        """Return the metrics."""
+        return web.Response(
+            body=self.exporter.async_render(),
+            headers={"Content-Type": CONTENT_TYPE},
+        )
@@ -0,0 +1,101 @@
+"""Normalization of the resolved sensor values against a compiled schema.
+
+Values are coerced to the type of their sensor and checked against its
+plausibility bounds once per payload, so entities read typed values.
+"""
+from __future__ import annotations
+
+from collections.abc import Hashable, Iterable, Mapping
+from dataclasses import dataclass
+import math
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .const import PoolSensorEntityDescription
+
+# Share of the checked values that may be invalid before the frame is dropped
+CORRUPT_FRAME_RATIO = 0.25
+
+
+class CorruptPayload(ValueError):
+    """Error raised when too many values of a payload are invalid."""
+
+
+@dataclass(frozen=True, slots=True)
+class _Rule:
+    """How a snapshot value is normalized."""
+
+    value_type: type[int] | type[float] | None
+    bounds: tuple[float, float] | None
+    enum_map: Mapping[Any, str] | None
+
+
+def _coerce(value: Any, value_type: type[int] | type[float]) -> int | float:
+    """Return a value as a number of the given type, raising ValueError."""
+    if isinstance(value, str):
+        value = float(value.strip())
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise ValueError(f"Not a number: {value!r}")
+    if not math.isfinite(value):
+        raise ValueError(f"Not a finite number: {value!r}")
+    return round(value) if value_type is int else float(value)
+
+
+class CompiledSchema:
+    """Normalization rules of the values and attributes of the sensors."""
+
+    def __init__(self, descriptions: Iterable[PoolSensorEntityDescription]) -> None:
+        """Compile the rules of the descriptions."""
+        self._rules: dict[Hashable, _Rule] = {}
+        for description in descriptions:
+            if description.value_type is None and not description.enum_map:
+                continue
+            self._rules[description.key] = _Rule(
+                description.value_type,
+                description.bounds,
+                dict(description.enum_map) or None,
+            )
+            # Attributes such as alarm limits share the type of the value
+            if description.value_type is not None:
+                for attr_key, _ in description.attributes:
+                    self._rules[(description.key, attr_key)] = _Rule(
+                        description.value_type, None, None
+                    )
+
+    def normalize(self, snapshot: dict[Hashable, Any]) -> int:
+        """Normalize a snapshot in place and return the number of violations.
+
+        Invalid values are removed. Raise CorruptPayload when so many values
+        are invalid that the frame cannot be trusted, or when none of the
+        values of the schema is present.
+        """
+        checked = violations = 0
+        for key, rule in self._rules.items():
+            if (value := snapshot.get(key)) is None:
+                continue
+            checked += 1
+
+            if rule.value_type is not None:
+                try:
+                    value = _coerce(value, rule.value_type)
+                except ValueError:
+                    violations += 1
+                    del snapshot[key]
+                    continue
+                if rule.bounds is not None and not (
+                    rule.bounds[0] <= value <= rule.bounds[1]
+                ):
+                    violations += 1
+                    del snapshot[key]
+                    continue
+
+            if rule.enum_map is not None:
+                value = rule.enum_map.get(value, value)
+            snapshot[key] = value
+
+        if self._rules and not checked:
+            # An empty or unrelated payload would blank every sensor
+            raise CorruptPayload("No value of the schema in the payload")
+        if violations and violations > checked * CORRUPT_FRAME_RATIO:
+            raise CorruptPayload(f"{violations} of {checked} values are invalid")
+        return violations
@@ -0,0 +1,64 @@
+"""Support for Pool Monitor numbers."""
+from __future__ import annotations
+
+from homeassistant.components.number import NumberEntity, NumberMode
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from . import PoolDataUpdateCoordinator
+from .const import DOMAIN, PUMP_MAX_RPM
+from .entity import PoolEntity
+
+PUMP_RPM_PATH = ("state", "cards", "pumps", 0, "rpm")
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up Pool Monitor numbers from a config entry."""
+    coordinator: PoolDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    # Controls need the command endpoint to be configured
+    if coordinator.writer is None:
+        return
+
+    async_add_entities([PoolPumpSpeedNumber(coordinator=coordinator, entry=entry)])
+
+
+class PoolPumpSpeedNumber(PoolEntity, NumberEntity):
+    """Number setting the speed of the first pump."""
+
+    _attr_name = "Pump Speed Setpoint"
+    _attr_icon = "mdi:pump"
+    _attr_native_min_value = 0
+    _attr_native_max_value = PUMP_MAX_RPM
+    _attr_native_step = 50
+    _attr_native_unit_of_measurement = "RPM"
+    _attr_mode = NumberMode.SLIDER
+
+    def __init__(
+        self,
+        coordinator: PoolDataUpdateCoordinator,
+        entry: ConfigEntry,
+    ) -> None:
+        """Initialize the number."""
+        super().__init__(coordinator, entry, "pump_speed")
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        # Follows the changes of the pump speed sensor
+        if "pump_rpm" in self.coordinator.changed_sensors:
+            self.async_write_ha_state()
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the speed of the pump."""
+        return self.coordinator.snapshot.get("pump_rpm")
+
+    async def async_set_native_value(self, value: float) -> None:
+        """Set the speed of the pump."""
+        await self.coordinator.writer.async_set(PUMP_RPM_PATH, int(value))
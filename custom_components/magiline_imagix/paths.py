@@ -0,0 +1,91 @@
+"""Compiled access paths into the pool info payload."""
+from __future__ import annotations
+
+from collections.abc import Hashable, Iterable, Mapping, Sequence
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .const import PoolSensorEntityDescription
+
+PathKey = str | int
+
+
+class _PathNode:
+    """A node of the path prefix trie."""
+
+    __slots__ = ("children", "targets")
+
+    def __init__(self) -> None:
+        """Initialize an empty node."""
+        self.children: dict[PathKey, _PathNode] = {}
+        self.targets: list[Hashable] = []
+
+
+class CompiledPaths:
+    """Resolve many payload paths in a single walk of the payload.
+
+    Paths sharing a prefix (e.g. ``state.cards.pumps[0]``) are merged into
+    a trie so every prefix is only walked once per payload.
+    """
+
+    def __init__(self, paths: Mapping[Hashable, Sequence[PathKey]]) -> None:
+        """Build the prefix trie for the given snapshot keys and paths."""
+        self._root = _PathNode()
+        for target, path in paths.items():
+            node = self._root
+            for key in path:
+                node = node.children.setdefault(key, _PathNode())
+            node.targets.append(target)
+
+    def resolve(self, data: Any) -> dict[Hashable, Any]:
+        """Return a flat snapshot of every path found in the payload.
+
+        Paths that cannot be followed (missing key, short list, wrong type)
+        are left out of the snapshot.
+        """
+        snapshot: dict[Hashable, Any] = {}
+        stack = [(self._root, data)]
+
+        while stack:
+            node, value = stack.pop()
+            for target in node.targets:
+                snapshot[target] = value
+
+            for key, child in node.children.items():
+                if isinstance(key, int):
+                    # Array index
+                    if isinstance(value, list) and len(value) > key:
+                        stack.append((child, value[key]))
+                elif isinstance(value, dict) and key in value:
+                    # Dictionary key
+                    stack.append((child, value[key]))
+
+        return snapshot
+
+
+def compile_sensor_paths(
+    descriptions: Iterable[PoolSensorEntityDescription],
+) -> CompiledPaths:
+    """Compile the paths of sensor descriptions.
+
+    The value of a sensor is stored under its key, each of its attributes
+    under a ``(key, attribute)`` tuple.
+    """
+    paths: dict[Hashable, Sequence[PathKey]] = {}
+    for description in descriptions:
+        paths[description.key] = description.path
+        for attr_key, attr_path in description.attributes:
+            paths[(description.key, attr_key)] = attr_path
+
+    return CompiledPaths(paths)
+
+
+def diff_snapshots(
+    old: Mapping[Hashable, Any], new: Mapping[Hashable, Any]
+) -> set[Hashable]:
+    """Return the snapshot keys that were added, removed or changed."""
+    return {
+        key
+        for key in old.keys() | new.keys()
+        if key not in old or key not in new or old[key] != new[key]
+    }
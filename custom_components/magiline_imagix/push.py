@@ -0,0 +1,74 @@
+"""Ingestion of pool payloads pushed to a webhook."""
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from aiohttp import hdrs, web
+
+from homeassistant.components import webhook
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_WEBHOOK_ID
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+
+from .const import DOMAIN, MAX_PAYLOAD_SIZE
+
+if TYPE_CHECKING:
+    from . import PoolDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@callback
+def async_setup_push(
+    hass: HomeAssistant, entry: ConfigEntry, coordinator: PoolDataUpdateCoordinator
+) -> CALLBACK_TYPE:
+    """Register the webhook receiving the payloads of a controller.
+
+    The controller, or a relay on the LAN, posts the same JSON document as
+    the pool info endpoint whenever it changes.
+    """
+    if (webhook_id := entry.data.get(CONF_WEBHOOK_ID)) is None:
+        # Keep the same URL across restarts so the sender needs no update
+        webhook_id = webhook.async_generate_id()
+        hass.config_entries.async_update_entry(
+            entry, data={**entry.data, CONF_WEBHOOK_ID: webhook_id}
+        )
+
+    async def _async_handle_webhook(
+        hass: HomeAssistant, webhook_id: str, request: web.Request
+    ) -> web.Response:
+        """Feed a pushed payload to the coordinator."""
+        if (request.content_length or 0) > MAX_PAYLOAD_SIZE:
+            return web.Response(status=413)
+        body = await request.read()
+        if len(body) > MAX_PAYLOAD_SIZE:
+            return web.Response(status=413)
+
+        try:
+            coordinator.async_ingest_payload(body)
+        except ValueError as err:
+            _LOGGER.debug("Invalid payload pushed to %s: %s", entry.title, err)
+            return web.Response(status=400)
+        return web.Response(status=204)
+
+    webhook.async_register(
+        hass,
+        DOMAIN,
+        entry.title,
+        webhook_id,
+        _async_handle_webhook,
+        local_only=True,
+        allowed_methods=[hdrs.METH_POST, hdrs.METH_PUT],
+    )
+    _LOGGER.info(
+        "Accepting pushed payloads for %s at %s",
+        entry.title,
+        webhook.async_generate_path(webhook_id),
+    )
+
+    @callback
+    def _async_unregister() -> None:
+        webhook.async_unregister(hass, webhook_id)
+
+    return _async_unregister
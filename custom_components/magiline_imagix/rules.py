@@ -0,0 +1,138 @@
+"""Alarm rules evaluated against the sensor values on every refresh.
+
+A rule is active while a value is above or below a limit, given as a number
+or read from the payload like the alarm limits of the controller. It only
+clears once the value is back inside the limits by its hysteresis, and a
+change must last for its delay before the rule flips.
+
+Extra rules are written one per line, such as
+``filter_clogging > 80 hysteresis 5 for 600``.
+"""
+from __future__ import annotations
+
+from collections.abc import Hashable, Iterable, Mapping
+from dataclasses import dataclass
+from decimal import Decimal
+import re
+from typing import Any
+
+_RULE = re.compile(
+    r"^(?P<source>[a-z][a-z0-9_]*)\s*(?P<operator>[<>])\s*(?P<limit>-?\d+(?:\.\d+)?)"
+    r"(?:\s+hysteresis\s+(?P<hysteresis>\d+(?:\.\d+)?))?"
+    r"(?:\s+for\s+(?P<delay>\d+)s?)?$"
+)
+
+
+@dataclass(frozen=True, slots=True)
+class AlarmRule:
+    """A limit on a sensor value."""
+
+    key: str
+    name: str
+    source: str
+    # Limits as numbers, or as keys of the snapshot holding them
+    above: float | Hashable | None = None
+    below: float | Hashable | None = None
+    hysteresis: float = 0.0
+    delay: float = 0.0  # seconds
+
+
+def _number(value: Any) -> float | None:
+    """Return a value as a float, if it is a number."""
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    return float(value)
+
+
+def _limit(limit: float | Hashable | None, values: Mapping[Hashable, Any]) -> float | None:
+    """Return the value of a limit, reading it from the values if needed."""
+    if limit is None or isinstance(limit, (int, float)):
+        return limit
+    return _number(values.get(limit))
+
+
+def parse_rules(text: str) -> list[AlarmRule]:
+    """Return the rules written one per line, raising ValueError if invalid."""
+    rules = []
+    for line in text.splitlines():
+        if not (line := line.strip()) or line.startswith("#"):
+            continue
+        if (match := _RULE.match(line)) is None:
+            raise ValueError(f"Invalid alarm rule: {line}")
+
+        limit = float(match["limit"])
+        operator = "above" if match["operator"] == ">" else "below"
+        # Editing the hysteresis or the delay keeps the entity of a rule.
+        # The limit is written exactly, without trailing zeros or exponent.
+        exact = Decimal(match["limit"]).normalize()
+        number = format(exact if exact else Decimal(0), "f")
+        number = number.replace("-", "m").replace(".", "_")
+        key = f"rule_{match['source']}_{operator}_{number}"
+        if any(rule.key == key for rule in rules):
+            raise ValueError(f"Duplicate alarm rule: {line}")
+        rules.append(
+            AlarmRule(
+                key=key,
+                name=line,
+                source=match["source"],
+                above=limit if match["operator"] == ">" else None,
+                below=limit if match["operator"] == "<" else None,
+                hysteresis=float(match["hysteresis"] or 0),
+                delay=float(match["delay"] or 0),
+            )
+        )
+    return rules
+
+
+class _RuleState:
+    """Evaluation state of one rule."""
+
+    __slots__ = ("active", "pending_since")
+
+    def __init__(self) -> None:
+        """Initialize the state."""
+        self.active: bool | None = None
+        self.pending_since: float | None = None
+
+
+class AlarmEngine:
+    """Evaluate every rule in one pass over the values of a refresh."""
+
+    def __init__(self, rules: Iterable[AlarmRule]) -> None:
+        """Initialize the engine."""
+        self.rules = tuple(rules)
+        self._states = {rule.key: _RuleState() for rule in self.rules}
+
+    def is_active(self, key: str) -> bool | None:
+        """Return whether a rule is active, None until it was evaluated."""
+        return self._states[key].active
+
+    def evaluate(self, now: float, values: Mapping[Hashable, Any]) -> list[str]:
+        """Evaluate the rules and return the keys of those that flipped."""
+        flipped = []
+        for rule in self.rules:
+            if (value := _number(values.get(rule.source))) is None:
+                continue
+
+            state = self._states[rule.key]
+            above = _limit(rule.above, values)
+            below = _limit(rule.below, values)
+            # An active rule needs the value back inside by the hysteresis
+            margin = rule.hysteresis if state.active else 0.0
+            target = (above is not None and value > above - margin) or (
+                below is not None and value < below + margin
+            )
+
+            if target == state.active:
+                state.pending_since = None
+                continue
+            if state.active is not None and rule.delay:
+                if state.pending_since is None:
+                    state.pending_since = now
+                if now - state.pending_since < rule.delay:
+                    continue
+
+            state.active = target
+            state.pending_since = None
+            flipped.append(rule.key)
+        return flipped
@@ -0,0 +1,63 @@
+"""Adaptive poll scheduling for the Pool Monitor integration."""
+from __future__ import annotations
+
+from collections.abc import Collection
+from datetime import timedelta
+import re
+
+from .const import ACTIVITY_SENSORS
+
+# Suffix of the extra instances of a templated sensor (pump_rpm_2, ...)
+_INSTANCE_SUFFIX = re.compile(r"_\d+$")
+
+
+def _is_activity(key: str) -> bool:
+    """Return whether a sensor, or the template it is an instance of, means activity."""
+    return key in ACTIVITY_SENSORS or _INSTANCE_SUFFIX.sub("", key) in ACTIVITY_SENSORS
+
+
+class AdaptiveScheduler:
+    """Pick the next poll interval from the pool's activity.
+
+    Polls fast while something is moving, returns to the configured
+    interval on any other change and backs off exponentially up to a
+    ceiling while the payload stays identical. Failures back off from the
+    configured interval up to their own, larger ceiling.
+    """
+
+    def __init__(
+        self,
+        base: timedelta,
+        fast: timedelta,
+        ceiling: timedelta,
+        failure_ceiling: timedelta,
+    ) -> None:
+        """Initialize the scheduler."""
+        self._base = base
+        self._fast = min(fast, base)
+        self._ceiling = max(ceiling, base)
+        self._failure_ceiling = max(failure_ceiling, self._ceiling)
+        self.interval = base
+        self.failures = 0
+
+    def record_success(self, changed_sensors: Collection[str]) -> timedelta:
+        """Return the next interval after a successful refresh."""
+        self.failures = 0
+
+        if any(_is_activity(key) for key in changed_sensors):
+            self.interval = self._fast
+        elif changed_sensors:
+            self.interval = self._base
+        else:
+            self.interval = min(self.interval * 2, self._ceiling)
+
+        return self.interval
+
+    def record_failure(self) -> timedelta:
+        """Return the next interval after a failed refresh."""
+        self.failures += 1
+        # The exponent stops growing long after the ceiling is reached
+        self.interval = min(
+            self._base * 2 ** min(self.failures, 16), self._failure_ceiling
+        )
+        return self.interval
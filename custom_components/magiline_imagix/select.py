@@ -0,0 +1,62 @@
+"""Support for Pool Monitor selects."""
+from __future__ import annotations
+
+from homeassistant.components.select import SelectEntity
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from . import PoolDataUpdateCoordinator
+from .const import DOMAIN, FILTRATION_MODE_CODES
+from .entity import PoolEntity
+
+FILTRATION_MODE_PATH = ("state", "filtration", "mode")
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up Pool Monitor selects from a config entry."""
+    coordinator: PoolDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    # Controls need the command endpoint to be configured
+    if coordinator.writer is None:
+        return
+
+    async_add_entities([PoolFiltrationModeSelect(coordinator=coordinator, entry=entry)])
+
+
+class PoolFiltrationModeSelect(PoolEntity, SelectEntity):
+    """Select setting the filtration mode, by its raw code."""
+
+    _attr_name = "Filtration Mode Setpoint"
+    _attr_icon = "mdi:filter-cog"
+    _attr_options = [str(code) for code in FILTRATION_MODE_CODES]
+
+    def __init__(
+        self,
+        coordinator: PoolDataUpdateCoordinator,
+        entry: ConfigEntry,
+    ) -> None:
+        """Initialize the select."""
+        super().__init__(coordinator, entry, "filtration_mode_setpoint")
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        # Follows the changes of the filtration mode sensor
+        if "filtration_mode" in self.coordinator.changed_sensors:
+            self.async_write_ha_state()
+
+    @property
+    def current_option(self) -> str | None:
+        """Return the code of the current filtration mode."""
+        if (mode := self.coordinator.snapshot.get("filtration_mode")) is None:
+            return None
+        return option if (option := str(mode)) in self.options else None
+
+    async def async_select_option(self, option: str) -> None:
+        """Set the filtration mode."""
+        await self.coordinator.writer.async_set(FILTRATION_MODE_PATH, int(option))
@@ -2,163 +2,316 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
 from typing import Any
 
 from homeassistant.components.sensor import (
+    SensorDeviceClass,
     SensorEntity,
+    SensorEntityDescription,
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_HOST
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
-from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import (
-    CoordinatorEntity,
-    DataUpdateCoordinator,
+from homeassistant.const import (
+    CONF_HOST,
+    EntityCategory,
+    UnitOfInformation,
+    UnitOfTime,
 )
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN, SENSOR_DEFINITIONS
+from . import PoolDataUpdateCoordinator
+from .const import (
+    DERIVED_SENSOR_DEFINITIONS,
+    DOMAIN,
+    STATISTIC_ATTRIBUTES,
+    DerivedSensorEntityDescription,
+    PoolSensorEntityDescription,
+)
+from .entity import PoolEntity
 
 _LOGGER = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True, kw_only=True)
+class PoolDiagnosticSensorEntityDescription(SensorEntityDescription):
+    """Describes a sensor reporting on the coordinator itself."""
+
+    value_fn: Callable[[PoolDataUpdateCoordinator], Any]
+
+
+def _last_timing_ms(coordinator: PoolDataUpdateCoordinator, name: str) -> float | None:
+    """Return a duration of the latest refresh in milliseconds."""
+    if (timing := coordinator.stats.last) is None or getattr(timing, name) is None:
+        return None
+    return round(getattr(timing, name) * 1000, 1)
+
+
+DIAGNOSTIC_SENSORS: tuple[PoolDiagnosticSensorEntityDescription, ...] = (
+    PoolDiagnosticSensorEntityDescription(
+        key="scan_interval",
+        name="Scan Interval",
+        icon="mdi:timer-refresh",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda coordinator: coordinator.poll_interval.total_seconds(),
+    ),
+    PoolDiagnosticSensorEntityDescription(
+        key="payload_cache_hits",
+        name="Payload Cache Hits",
+        icon="mdi:cached",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda coordinator: coordinator.cache_hits,
+    ),
+    PoolDiagnosticSensorEntityDescription(
+        key="payload_cache_misses",
+        name="Payload Cache Misses",
+        icon="mdi:cached",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda coordinator: coordinator.cache_misses,
+    ),
+    PoolDiagnosticSensorEntityDescription(
+        key="schema_violations",
+        name="Invalid Values",
+        icon="mdi:alert-circle-outline",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda coordinator: coordinator.schema_violations,
+    ),
+    PoolDiagnosticSensorEntityDescription(
+        key="refresh_duration",
+        name="Refresh Duration",
+        icon="mdi:timer-outline",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda coordinator: _last_timing_ms(coordinator, "total"),
+    ),
+    PoolDiagnosticSensorEntityDescription(
+        key="dispatch_duration",
+        name="Entity Update Duration",
+        icon="mdi:timer-outline",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda coordinator: _last_timing_ms(coordinator, "dispatch"),
+    ),
+    PoolDiagnosticSensorEntityDescription(
+        key="payload_size",
+        name="Payload Size",
+        icon="mdi:code-json",
+        device_class=SensorDeviceClass.DATA_SIZE,
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda coordinator: (
+            coordinator.stats.last.payload_size if coordinator.stats.last else None
+        ),
+    ),
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Pool Monitor sensors from a config entry."""
-    coordinator: DataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator: PoolDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
     
     sensors = []
     
-    # Create sensors based on definitions
-    for sensor_def in SENSOR_DEFINITIONS:
+    for description in DIAGNOSTIC_SENSORS:
+        sensors.append(
+            PoolDiagnosticSensor(
+                coordinator=coordinator,
+                entry=entry,
+                description=description,
+            )
+        )
+
+    for description in DERIVED_SENSOR_DEFINITIONS:
         sensors.append(
-            PoolSensor(
+            DerivedSensor(
                 coordinator=coordinator,
                 entry=entry,
-                sensor_def=sensor_def,
+                description=description,
             )
         )
     
     async_add_entities(sensors)
 
+    # Sensors are created from the descriptions expanded by the coordinator
+    # for the instances found in the payload and follow its changes
+    pool_sensors: dict[str, PoolSensor] = {}
+    synced: list[PoolSensorEntityDescription] | None = None
 
-class PoolSensor(CoordinatorEntity, SensorEntity):
+    @callback
+    def _async_sync_sensors() -> None:
+        """Add sensors and flag those missing to match the expanded descriptions."""
+        nonlocal synced
+        if coordinator.descriptions is synced:
+            return
+        synced = coordinator.descriptions
+
+        # Sensors of instances gone from the payload stay registered, so a
+        # short list in one payload does not lose their registry settings
+        descriptions = {description.key: description for description in synced}
+        for key, sensor in pool_sensors.items():
+            if (present := key in descriptions) == sensor.present:
+                continue
+            _LOGGER.debug(
+                "Sensor %s %s the payload", key, "back in" if present else "no longer in"
+            )
+            sensor.present = present
+            if sensor.hass is not None:
+                sensor.async_write_ha_state()
+
+        new_sensors = [
+            PoolSensor(coordinator=coordinator, entry=entry, description=description)
+            for key, description in descriptions.items()
+            if key not in pool_sensors
+        ]
+        for sensor in new_sensors:
+            pool_sensors[sensor.key] = sensor
+        if new_sensors:
+            async_add_entities(new_sensors)
+
+    _async_sync_sensors()
+    entry.async_on_unload(coordinator.async_add_listener(_async_sync_sensors))
+
+
+class PoolSensor(PoolEntity, SensorEntity):
     """Representation of a Pool Monitor sensor."""
 
-    _attr_has_entity_name = True
+    # Statistics of the publish window change with every published state
+    _unrecorded_attributes = frozenset(STATISTIC_ATTRIBUTES)
+    entity_description: PoolSensorEntityDescription
 
     def __init__(
         self,
-        coordinator: DataUpdateCoordinator,
+        coordinator: PoolDataUpdateCoordinator,
         entry: ConfigEntry,
-        sensor_def: dict,
+        description: PoolSensorEntityDescription,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
-        
-        self._sensor_def = sensor_def
-        self._attr_unique_id = f"{entry.entry_id}_{sensor_def['key']}"
-        self._attr_translation_key = sensor_def["key"]
-        self._entry = entry
-        
-        # Set name
-        self._attr_name = sensor_def["name"]
+        super().__init__(coordinator, entry, description.key)
         
-        # Set icon
-        if "icon" in sensor_def:
-            self._attr_icon = sensor_def["icon"]
-        
-        # Set device class if specified
-        if "device_class" in sensor_def:
-            self._attr_device_class = sensor_def["device_class"]
-        
-        # Set state class if specified
-        if "state_class" in sensor_def:
-            self._attr_state_class = sensor_def["state_class"]
-        
-        # Set unit of measurement if specified
-        if "unit" in sensor_def:
-            self._attr_native_unit_of_measurement = sensor_def["unit"]
-        
-        # Set device info for grouping
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry.entry_id)},
-            name="Pool Monitor",
-            manufacturer="Pool Controller",
-            model="API Integration",
+        self.entity_description = description
+        self._attr_translation_key = description.key
+
+        # Snapshot keys of the attributes, built once
+        attribute_names = [attr_key for attr_key, _ in description.attributes]
+        if description.deadband is not None:
+            attribute_names.extend(STATISTIC_ATTRIBUTES)
+        self._attribute_keys = tuple(
+            (attr_key, (description.key, attr_key)) for attr_key in attribute_names
         )
+        self._attrs: Mapping[str, Any] | None = None
+        self._attrs_generation: int | None = None
+
+        # Cleared while the instance is missing from the payload
+        self.present = True
 
     @property
     def native_value(self) -> Any:
         """Return the state of the sensor."""
-        if not self.coordinator.data:
-            return None
-        
-        # Navigate through the data path
-        value = self.coordinator.data
-        path = self._sensor_def["path"]
-        
-        try:
-            for key in path:
-                if isinstance(key, int):
-                    # Array index
-                    if isinstance(value, list) and len(value) > key:
-                        value = value[key]
-                    else:
-                        return None
-                else:
-                    # Dictionary key
-                    if isinstance(value, dict) and key in value:
-                        value = value[key]
-                    else:
-                        return None
-            
-            return value
-            
-        except (KeyError, IndexError, TypeError) as err:
-            _LOGGER.debug(
-                "Error getting value for %s: %s", self._attr_name, err
-            )
-            return None
+        # Resolved once per refresh by the coordinator
+        return self.coordinator.snapshot.get(self.key)
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        # Sensor is available if we have data, even if update failed
-        return self.coordinator.data is not None
+        return self.present and super().available
 
     @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
+    def extra_state_attributes(self) -> Mapping[str, Any] | None:
         """Return additional attributes if specified."""
-        if "attributes" not in self._sensor_def:
-            return None
-        
-        if not self.coordinator.data:
-            return None
-        
+        # Home Assistant reads this several times per state write, build
+        # it once per coordinator generation
+        if self._attrs_generation != self.coordinator.generation:
+            self._attrs_generation = self.coordinator.generation
+            self._attrs = self._build_attributes()
+        return self._attrs
+
+    def _build_attributes(self) -> Mapping[str, Any] | None:
+        """Return the attributes resolved from the current snapshot."""
+        snapshot = self.coordinator.snapshot
         attrs = {}
-        for attr_key, attr_path in self._sensor_def["attributes"].items():
-            value = self.coordinator.data
-            try:
-                for key in attr_path:
-                    if isinstance(key, int):
-                        if isinstance(value, list) and len(value) > key:
-                            value = value[key]
-                        else:
-                            break
-                    else:
-                        if isinstance(value, dict) and key in value:
-                            value = value[key]
-                        else:
-                            break
-                else:
-                    # Only add attribute if we successfully navigated the path
-                    attrs[attr_key] = value
-            except (KeyError, IndexError, TypeError):
-                pass
+        for attr_key, snapshot_key in self._attribute_keys:
+            # Only add attribute if its path was found in the payload
+            if snapshot_key in snapshot:
+                attrs[attr_key] = snapshot[snapshot_key]
+
+        # Flag values restored from the cache until the controller answers
+        if (cached_at := self.coordinator.cached_at) is not None:
+            attrs["stale"] = True
+            attrs["last_updated"] = cached_at.isoformat()
+        
+        return MappingProxyType(attrs) if attrs else None
+
+
+class DerivedSensor(PoolEntity, SensorEntity):
+    """Representation of a sensor derived from other Pool Monitor sensors."""
+
+    entity_description: DerivedSensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: PoolDataUpdateCoordinator,
+        entry: ConfigEntry,
+        description: DerivedSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry, description.key)
+
+        self.entity_description = description
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the state of the sensor."""
+        return self.coordinator.derived[self.key].value
+
+
+class PoolDiagnosticSensor(PoolEntity, SensorEntity):
+    """Representation of a Pool Monitor diagnostic sensor."""
+
+    entity_description: PoolDiagnosticSensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: PoolDataUpdateCoordinator,
+        entry: ConfigEntry,
+        description: PoolDiagnosticSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry, description.key)
         
-        return attrs if attrs else None
+        self.entity_description = description
+        self._attr_native_value = description.value_fn(coordinator)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        value = self.entity_description.value_fn(self.coordinator)
+        if value != self._attr_native_value:
+            self._attr_native_value = value
+            self.async_write_ha_state()
+
+    @property
+    def available(self) -> bool:
+        """Return if entity is available."""
+        # Reports on the coordinator, so it stays meaningful when polls fail
+        return True
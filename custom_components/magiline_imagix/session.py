@@ -0,0 +1,28 @@
+"""HTTP sessions dedicated to a pool controller."""
+from __future__ import annotations
+
+import aiohttp
+
+from .const import DNS_CACHE_TTL, KEEPALIVE_TIMEOUT
+from .instrumentation import create_trace_config
+
+
+def create_session(connect_timeout: float, read_timeout: float) -> aiohttp.ClientSession:
+    """Create a session holding one keep-alive connection to a controller.
+
+    The controller's embedded HTTP server copes badly with parallel
+    connections, so the connector never opens more than one.
+    """
+    connector = aiohttp.TCPConnector(
+        limit=1,
+        limit_per_host=1,
+        ttl_dns_cache=DNS_CACHE_TTL,
+        keepalive_timeout=KEEPALIVE_TIMEOUT,
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        timeout=aiohttp.ClientTimeout(
+            total=None, connect=connect_timeout, sock_read=read_timeout
+        ),
+        trace_configs=[create_trace_config()],
+    )
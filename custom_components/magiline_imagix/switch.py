@@ -0,0 +1,67 @@
+"""Support for Pool Monitor switches."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.switch import SwitchEntity
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from . import PoolDataUpdateCoordinator
+from .const import DOMAIN
+from .entity import PoolEntity
+
+SPOTLIGHT_PATH = ("state", "spotlight", "state")
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up Pool Monitor switches from a config entry."""
+    coordinator: PoolDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    # Controls need the command endpoint to be configured
+    if coordinator.writer is None:
+        return
+
+    async_add_entities([PoolSpotlightSwitch(coordinator=coordinator, entry=entry)])
+
+
+class PoolSpotlightSwitch(PoolEntity, SwitchEntity):
+    """Switch turning the pool spotlight on and off."""
+
+    _attr_name = "Spotlight"
+    _attr_icon = "mdi:spotlight"
+
+    def __init__(
+        self,
+        coordinator: PoolDataUpdateCoordinator,
+        entry: ConfigEntry,
+    ) -> None:
+        """Initialize the switch."""
+        super().__init__(coordinator, entry, "spotlight")
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        # Follows the changes of the spotlight state sensor
+        if "spotlight_state" in self.coordinator.changed_sensors:
+            self.async_write_ha_state()
+
+    @property
+    def is_on(self) -> bool | None:
+        """Return if the spotlight is on."""
+        if (state := self.coordinator.snapshot.get("spotlight_state")) is None:
+            return None
+        return bool(state)
+
+    async def async_turn_on(self, **kwargs: Any) -> None:
+        """Turn the spotlight on."""
+        await self.coordinator.writer.async_set(SPOTLIGHT_PATH, 1)
+
+    async def async_turn_off(self, **kwargs: Any) -> None:
+        """Turn the spotlight off."""
+        await self.coordinator.writer.async_set(SPOTLIGHT_PATH, 0)
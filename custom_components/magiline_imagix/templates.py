@@ -0,0 +1,95 @@
+"""Expansion of templated sensor descriptions against the payload.
+
+A ``"*"`` in a description path stands for every element of the list found
+at that point of the payload, e.g. every pump of ``state.cards.pumps``.
+Each path may hold at most one wildcard.
+"""
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+import dataclasses
+from typing import TYPE_CHECKING, Any
+
+from .paths import PathKey
+
+if TYPE_CHECKING:
+    from .const import PoolSensorEntityDescription
+
+WILDCARD = "*"
+
+Prefix = tuple[PathKey, ...]
+
+
+def _prefix(path: Sequence[PathKey]) -> Prefix | None:
+    """Return the part of a path before its wildcard, if it has one."""
+    if WILDCARD not in path:
+        return None
+    return tuple(path[: path.index(WILDCARD)])
+
+
+def template_prefixes(
+    descriptions: Iterable[PoolSensorEntityDescription],
+) -> tuple[Prefix, ...]:
+    """Return the distinct list paths the templated descriptions expand over."""
+    prefixes: dict[Prefix, None] = {}
+    for description in descriptions:
+        if (prefix := _prefix(description.path)) is not None:
+            prefixes[prefix] = None
+    return tuple(prefixes)
+
+
+def shape_signature(data: Any, prefixes: Sequence[Prefix]) -> tuple[int, ...]:
+    """Return the number of instances found at each templated list.
+
+    Only the few template prefixes are walked, so this is cheap enough to
+    run on every refresh and only expand the descriptions when it changes.
+    """
+    signature = []
+    for prefix in prefixes:
+        value = data
+        for key in prefix:
+            if isinstance(key, int):
+                value = value[key] if isinstance(value, list) and len(value) > key else None
+            else:
+                value = value.get(key) if isinstance(value, dict) else None
+        signature.append(len(value) if isinstance(value, list) else 0)
+    return tuple(signature)
+
+
+def _instance_path(path: Sequence[PathKey], index: int) -> tuple[PathKey, ...]:
+    """Return a path with its wildcard replaced by an index."""
+    return tuple(index if key == WILDCARD else key for key in path)
+
+
+def expand_sensor_descriptions(
+    descriptions: Iterable[PoolSensorEntityDescription],
+    prefixes: Sequence[Prefix],
+    signature: Sequence[int],
+) -> list[PoolSensorEntityDescription]:
+    """Return one description per instance found for templated descriptions.
+
+    The first instance keeps the key and name of the template so existing
+    entities keep their unique IDs, the following ones get a number suffix.
+    """
+    counts = dict(zip(prefixes, signature))
+    expanded: list[PoolSensorEntityDescription] = []
+
+    for description in descriptions:
+        if (prefix := _prefix(description.path)) is None:
+            expanded.append(description)
+            continue
+
+        for index in range(counts.get(prefix, 0)):
+            changes: dict[str, Any] = {
+                "path": _instance_path(description.path, index),
+                "attributes": tuple(
+                    (attr_key, _instance_path(attr_path, index))
+                    for attr_key, attr_path in description.attributes
+                ),
+            }
+            if index:
+                changes["key"] = f"{description.key}_{index + 1}"
+                changes["name"] = f"{description.name} {index + 1}"
+            expanded.append(dataclasses.replace(description, **changes))
+
+    return expanded
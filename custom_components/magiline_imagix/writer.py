@@ -0,0 +1,89 @@
+"""Debounced submission of commands to the pool controller."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Sequence
+import logging
+from typing import TYPE_CHECKING, Any
+
+import aiohttp
+import async_timeout
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
+
+from .const import COMMAND_DEBOUNCE
+from .paths import PathKey
+
+if TYPE_CHECKING:
+    from . import PoolDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class CommandWriter:
+    """Queue the values set by control entities and send them together.
+
+    Rapid changes, such as dragging the cover position, are merged so only
+    the last value of each path is sent, in a single request. The commanded
+    values are shown at once and confirmed by one refresh after the request.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        coordinator: PoolDataUpdateCoordinator,
+        command_path: str,
+    ) -> None:
+        """Initialize the writer."""
+        self.coordinator = coordinator
+        self.url = f"http://{coordinator.host}{command_path}"
+        self.commands_sent = 0
+        self._pending: dict[tuple[PathKey, ...], Any] = {}
+        self._debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=COMMAND_DEBOUNCE,
+            immediate=False,
+            function=self._async_flush,
+        )
+
+    async def async_set(self, path: Sequence[PathKey], value: Any) -> None:
+        """Queue a value to write at a path of the payload."""
+        self._pending[tuple(path)] = value
+        self.coordinator.async_apply_optimistic(path, value)
+        await self._debouncer.async_call()
+
+    async def _async_flush(self) -> None:
+        """Send the queued values in one request and confirm them."""
+        pending, self._pending = self._pending, {}
+        if not pending:
+            return
+
+        body = {
+            "set": [
+                {"path": list(path), "value": value} for path, value in pending.items()
+            ]
+        }
+        try:
+            async with (
+                async_timeout.timeout(self.coordinator.timeout),
+                self.coordinator.session.post(self.url, json=body) as response,
+            ):
+                if response.status >= 400:
+                    _LOGGER.error(
+                        "Pool controller rejected command with HTTP %s", response.status
+                    )
+                else:
+                    self.commands_sent += 1
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+            _LOGGER.error("Error sending command to pool controller: %s", err)
+
+        # Confirms the values, or reverts them when the command failed
+        await self.coordinator.async_refresh_now()
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Drop the queued values."""
+        self._pending.clear()
+        self._debouncer.async_shutdown()
@@ -0,0 +1,344 @@
+"""End-to-end benchmark of the integration against a pool controller.
+
+Drives ``PoolDataUpdateCoordinator`` and ``PoolSensor`` against a real
+controller or ``scripts/simulator.py`` and reports polls per second,
+p50/p99 refresh latency, the cost of computing each entity's state and
+the memory held by each entity. Also compares resolving every sensor
+path with one walk per entity against the compiled prefix trie, and the
+decode time and peak allocation of json and orjson on a large payload,
+and the cost of a request over the kept-alive connection of the
+controller session against a new connection per request.
+Requires Home Assistant to be installed::
+
+    python scripts/simulator.py --port 11000 &
+    python scripts/benchmark.py --host 127.0.0.1:11000 --polls 500
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import Callable, Sequence
+from datetime import timedelta
+import json
+import pathlib
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from types import MappingProxyType, SimpleNamespace
+from typing import Any
+
+import aiohttp
+from aiohttp import web
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / "custom_components"))
+
+from homeassistant.config_entries import ConfigEntry  # noqa: E402
+from homeassistant.const import CONF_HOST  # noqa: E402
+from homeassistant.core import HomeAssistant  # noqa: E402
+
+from magiline_imagix import PoolDataUpdateCoordinator  # noqa: E402
+from magiline_imagix.const import (  # noqa: E402
+    CONF_PATH,
+    DOMAIN,
+    PoolSensorEntityDescription,
+)
+from magiline_imagix.hub import async_get_hub  # noqa: E402
+from magiline_imagix.paths import PathKey, compile_sensor_paths  # noqa: E402
+from magiline_imagix.sensor import PoolSensor  # noqa: E402
+from magiline_imagix.session import create_session  # noqa: E402
+
+
+def _percentile(values: list[float], percent: float) -> float:
+    """Return a percentile of the values."""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * percent / 100))]
+
+
+def _walk(data: Any, path: Sequence[PathKey]) -> Any:
+    """Follow one path from the root of the payload, as each entity used to."""
+    value = data
+    for key in path:
+        if isinstance(key, int):
+            if not isinstance(value, list) or len(value) <= key:
+                return None
+        elif not isinstance(value, dict) or key not in value:
+            return None
+        value = value[key]
+    return value
+
+
+def _path_resolution(
+    data: Any, descriptions: Sequence[PoolSensorEntityDescription], rounds: int
+) -> tuple[float, float]:
+    """Return the time to resolve every sensor path, per entity and compiled.
+
+    Times are per payload, in seconds.
+    """
+    paths = [
+        path
+        for description in descriptions
+        for path in (description.path, *(path for _, path in description.attributes))
+    ]
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for path in paths:
+            _walk(data, path)
+    walk = (time.perf_counter() - start) / rounds
+
+    compiled = compile_sensor_paths(descriptions)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        compiled.resolve(data)
+    trie = (time.perf_counter() - start) / rounds
+    return walk, trie
+
+
+def _decoding(
+    body: bytes, loads: Callable[[bytes], Any], rounds: int
+) -> tuple[float, int]:
+    """Return the time to decode a body, in seconds, and its peak allocation."""
+    start = time.perf_counter()
+    for _ in range(rounds):
+        loads(body)
+    elapsed = (time.perf_counter() - start) / rounds
+
+    # Traced separately, tracing slows down the decoding
+    tracemalloc.start()
+    loads(body)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+async def _async_time_requests(
+    session: aiohttp.ClientSession, url: str, requests: int
+) -> tuple[float, int]:
+    """Return the mean time of sequential requests and the connections opened."""
+    connections = 0
+
+    async def _on_connection_create_end(
+        session: aiohttp.ClientSession,
+        context: SimpleNamespace,
+        params: aiohttp.TraceConnectionCreateEndParams,
+    ) -> None:
+        nonlocal connections
+        connections += 1
+
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_connection_create_end.append(_on_connection_create_end)
+    trace_config.freeze()
+    session.trace_configs.append(trace_config)
+
+    start = time.perf_counter()
+    for _ in range(requests):
+        async with session.get(url) as response:
+            await response.read()
+    return (time.perf_counter() - start) / requests, connections
+
+
+async def async_handshake_savings(
+    data: Any, requests: int
+) -> dict[str, tuple[float, int]]:
+    """Time requests to a local stub server, with and without keep-alive."""
+    body = json.dumps(data).encode()
+
+    async def _handle(request: web.Request) -> web.Response:
+        return web.Response(body=body, content_type="application/json")
+
+    app = web.Application()
+    app.router.add_get("/", _handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+
+    results = {}
+    try:
+        sessions = {
+            "keep-alive": create_session(3, 10),
+            "new connection": aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(force_close=True)
+            ),
+        }
+        for name, session in sessions.items():
+            async with session:
+                results[name] = await _async_time_requests(
+                    session, f"http://127.0.0.1:{port}/", requests
+                )
+    finally:
+        await runner.cleanup()
+    return results
+
+
+def _entity_memory(
+    coordinator: PoolDataUpdateCoordinator, entry: ConfigEntry, pools: int
+) -> float:
+    """Return the memory allocated per sensor entity, in bytes.
+
+    Creates the sensors of ``pools`` pools at once to average out noise.
+    """
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    sensors = [
+        PoolSensor(coordinator, entry, description)
+        for _ in range(pools)
+        for description in coordinator.descriptions
+    ]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    allocated = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    return allocated / len(sensors)
+
+
+def _attribute_allocations(sensors: list[PoolSensor], reads: int = 3) -> int:
+    """Return the blocks allocated by sensor.py to read every sensor's attributes.
+
+    Home Assistant reads the attributes several times per state write,
+    ``reads`` times per sensor simulates one refresh.
+    """
+    only_sensor = [tracemalloc.Filter(True, "*/magiline_imagix/sensor.py")]
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot().filter_traces(only_sensor)
+    for sensor in sensors:
+        for _ in range(reads):
+            sensor.extra_state_attributes  # noqa: B018
+    after = tracemalloc.take_snapshot().filter_traces(only_sensor)
+    tracemalloc.stop()
+
+    return sum(stat.count_diff for stat in after.compare_to(before, "lineno"))
+
+
+async def async_run(args: argparse.Namespace) -> None:
+    """Run the benchmark."""
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        entry = ConfigEntry(
+            data={CONF_HOST: args.host, CONF_PATH: args.path},
+            discovery_keys=MappingProxyType({}),
+            domain=DOMAIN,
+            minor_version=1,
+            options={},
+            source="user",
+            subentries_data=None,
+            title="Benchmark",
+            unique_id=args.host,
+            version=1,
+        )
+        coordinator = PoolDataUpdateCoordinator(
+            hass,
+            entry,
+            host=args.host,
+            path=args.path,
+            scan_interval=timedelta(seconds=30),
+            hub=async_get_hub(hass),
+        )
+        await coordinator.async_refresh()
+        sensors = [
+            PoolSensor(coordinator, entry, description)
+            for description in coordinator.descriptions
+        ]
+        entity_memory = _entity_memory(coordinator, entry, args.memory_pools)
+        walk_time, trie_time = _path_resolution(
+            coordinator.data, coordinator.descriptions, args.rounds
+        )
+
+        # A large synthetic payload made of copies of the fetched one
+        body = json.dumps(
+            {"state": coordinator.data, "history": [coordinator.data] * args.decode_copies}
+        ).encode()
+        decoders = {"json": json.loads}
+        if orjson is not None:
+            decoders["orjson"] = orjson.loads
+        decoding = {
+            name: _decoding(body, loads, args.decode_rounds)
+            for name, loads in decoders.items()
+        }
+        handshakes = await async_handshake_savings(coordinator.data, args.polls)
+
+        latencies: list[float] = []
+        entity_costs: list[float] = []
+        failures = 0
+        start = time.perf_counter()
+
+        for _ in range(args.polls):
+            poll_start = time.perf_counter()
+            # Bypass the freshness window, back to back refreshes would
+            # otherwise reuse the last fetch
+            await coordinator.async_refresh_now()
+            latencies.append(time.perf_counter() - poll_start)
+            if not coordinator.last_update_success:
+                failures += 1
+
+            # What each entity computes on a coordinator update
+            entity_start = time.perf_counter()
+            for sensor in sensors:
+                if coordinator.async_should_write(sensor.key):
+                    sensor.native_value  # noqa: B018
+                    sensor.extra_state_attributes  # noqa: B018
+                    sensor.available  # noqa: B018
+            entity_costs.append((time.perf_counter() - entity_start) / len(sensors))
+
+        elapsed = time.perf_counter() - start
+
+        # Attribute allocations right after a refresh bringing a new payload
+        await coordinator.async_refresh_now()
+        attribute_allocations = _attribute_allocations(sensors)
+
+        await coordinator.session.close()
+        await hass.async_stop(force=True)
+
+    print(f"polls:            {args.polls} ({failures} failed)")
+    print(f"polls/sec:        {args.polls / elapsed:.1f}")
+    print(f"refresh p50:      {_percentile(latencies, 50) * 1000:.2f} ms")
+    print(f"refresh p99:      {_percentile(latencies, 99) * 1000:.2f} ms")
+    print(f"entity state p50: {_percentile(entity_costs, 50) * 1e6:.2f} µs")
+    print(f"entity state avg: {statistics.fmean(entity_costs) * 1e6:.2f} µs")
+    print(f"attribute allocs: {attribute_allocations} blocks per refresh")
+    print(f"paths per entity: {walk_time * 1e6:.2f} µs per payload")
+    print(f"paths compiled:   {trie_time * 1e6:.2f} µs per payload")
+    for name, (elapsed, peak) in decoding.items():
+        print(
+            f"decode {name + ':':<10}{elapsed * 1000:.2f} ms, peak {peak / 1024:.0f} KiB"
+            f" ({len(body) / 1024:.0f} KiB payload)"
+        )
+    for name, (elapsed, connections) in handshakes.items():
+        print(
+            f"stub {name + ':':<16}{elapsed * 1000:.3f} ms per request,"
+            f" {connections} connections"
+        )
+    print(f"entity memory:    {entity_memory:.0f} bytes ({args.memory_pools} pools)")
+    print(f"state writes:     {coordinator.state_writes} ({coordinator.skipped_writes} skipped)")
+
+
+def main() -> None:
+    """Parse the command line and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1:11000")
+    parser.add_argument("--path", default="/api/v1/pool/info")
+    parser.add_argument("--polls", type=int, default=200)
+    parser.add_argument(
+        "--rounds", type=int, default=10000, help="rounds of the micro-benchmarks"
+    )
+    parser.add_argument(
+        "--decode-copies", type=int, default=500, help="payload copies decoded"
+    )
+    parser.add_argument(
+        "--decode-rounds", type=int, default=20, help="rounds of the decode benchmark"
+    )
+    parser.add_argument(
+        "--memory-pools", type=int, default=100, help="pools created to measure entity memory"
+    )
+    asyncio.run(async_run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
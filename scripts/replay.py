@@ -0,0 +1,139 @@
+"""Replay of a capture log through the integration.
+
+Feeds the payloads captured by the integration's capture option through
+``PoolDataUpdateCoordinator`` and ``PoolSensor``, as fast as possible or
+at a multiple of real time, and reports the cost of each frame. The
+payloads of every endpoint are merged as the live polls merge them, and
+the derived sensors and alarm delays follow the capture times. Use it to
+benchmark the parsing path or check a change against real traffic.
+Requires Home Assistant to be installed::
+
+    python scripts/replay.py <config>/magiline_imagix/capture/<entry_id>
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from datetime import timedelta
+import pathlib
+import sys
+import tempfile
+import time
+from types import MappingProxyType
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / "custom_components"))
+
+from homeassistant.config_entries import ConfigEntry  # noqa: E402
+from homeassistant.const import CONF_HOST  # noqa: E402
+from homeassistant.core import HomeAssistant  # noqa: E402
+
+from magiline_imagix import PoolDataUpdateCoordinator  # noqa: E402
+from magiline_imagix.capture import iter_capture  # noqa: E402
+from magiline_imagix.const import (  # noqa: E402
+    CONF_PATH,
+    DEFAULT_PATH,
+    DEFAULT_SLOW_PATH,
+    DOMAIN,
+)
+from magiline_imagix.hub import async_get_hub  # noqa: E402
+from magiline_imagix.sensor import PoolSensor  # noqa: E402
+
+
+def _percentile(values: list[float], percent: float) -> float:
+    """Return a percentile of the values."""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * percent / 100))]
+
+
+async def async_run(args: argparse.Namespace) -> None:
+    """Replay the capture."""
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        entry = ConfigEntry(
+            data={CONF_HOST: "replay", CONF_PATH: args.path},
+            discovery_keys=MappingProxyType({}),
+            domain=DOMAIN,
+            minor_version=1,
+            options={},
+            source="user",
+            subentries_data=None,
+            title="Replay",
+            unique_id="replay",
+            version=1,
+        )
+        coordinator = PoolDataUpdateCoordinator(
+            hass,
+            entry,
+            host="replay",
+            path=args.path,
+            slow_path=args.slow_path or args.path,
+            scan_interval=timedelta(seconds=30),
+            hub=async_get_hub(hass),
+        )
+        paths = {endpoint.path for endpoint in coordinator.endpoints}
+        sensors: dict[str, PoolSensor] = {}
+
+        costs: list[float] = []
+        invalid = skipped = 0
+        previous_when: float | None = None
+        start = time.perf_counter()
+
+        for when, path, body in iter_capture(args.capture):
+            if path not in paths:
+                skipped += 1
+                continue
+            if args.speed and previous_when is not None:
+                await asyncio.sleep(max(0.0, when - previous_when) / args.speed)
+            previous_when = when
+
+            frame_start = time.perf_counter()
+            try:
+                coordinator.async_ingest_payload(body, path, captured_at=when)
+            except ValueError:
+                invalid += 1
+                continue
+
+            # Follow the sensors the payload describes, as the platform does
+            for description in coordinator.descriptions:
+                if description.key not in sensors:
+                    sensors[description.key] = PoolSensor(coordinator, entry, description)
+            for sensor in sensors.values():
+                if coordinator.async_should_write(sensor.key):
+                    sensor.native_value  # noqa: B018
+                    sensor.extra_state_attributes  # noqa: B018
+                    sensor.available  # noqa: B018
+            costs.append(time.perf_counter() - frame_start)
+
+        elapsed = time.perf_counter() - start
+        await coordinator.session.close()
+        await hass.async_stop(force=True)
+
+    if not costs:
+        print("No frames replayed")
+        return
+
+    print(f"frames:           {len(costs)} ({invalid} invalid, {skipped} skipped)")
+    print(f"frames/sec:       {len(costs) / elapsed:.1f}")
+    print(f"frame p50:        {_percentile(costs, 50) * 1e6:.2f} µs")
+    print(f"frame p99:        {_percentile(costs, 99) * 1e6:.2f} µs")
+    print(f"payload changes:  {coordinator.cache_misses} ({coordinator.cache_hits} unchanged)")
+    print(f"invalid values:   {coordinator.schema_violations}")
+    print(f"state writes:     {coordinator.state_writes} ({coordinator.skipped_writes} skipped)")
+
+
+def main() -> None:
+    """Parse the command line and run the replay."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("capture", type=pathlib.Path, help="capture directory")
+    parser.add_argument("--path", default=DEFAULT_PATH, help="main endpoint")
+    parser.add_argument(
+        "--slow-path", default=DEFAULT_SLOW_PATH, help="endpoint of the slow sensors"
+    )
+    parser.add_argument(
+        "--speed", type=float, default=0.0, help="multiple of real time, 0 for no delay"
+    )
+    asyncio.run(async_run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,332 @@
+"""Local simulator of the iMAGI-X pool controller API.
+
+Serves realistic ``/api/v1/pool/info`` payloads covering every field used
+by the integration, drifts the values over time and injects faults on
+demand. Run it with ``python scripts/simulator.py --port 11000`` and point
+the integration (or ``scripts/benchmark.py``) at ``127.0.0.1:11000``.
+
+Faults are set with command line flags or at runtime with
+``POST /simulator/faults`` and a JSON body such as
+``{"latency": 0.2, "error_rate": 0.1}``.
+
+Commands are accepted on ``POST /api/v1/pool/command`` with a body such
+as ``{"set": [{"path": ["state", "roller", "position"], "value": 40}]}``,
+the endpoint to set as command path in the integration options.
+
+With ``--push-url`` the payload is also posted to the webhook shown in the
+Home Assistant log whenever it changes, to exercise the push mode.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import copy
+import json
+import random
+import time
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from aiohttp import ClientError, ClientSession, web
+
+DEFAULT_PATH = "/api/v1/pool/info"
+DEFAULT_COMMAND_PATH = "/api/v1/pool/command"
+
+
+@dataclass
+class Faults:
+    """Faults injected into the responses."""
+
+    latency: float = 0.0  # seconds added to every response
+    error_rate: float = 0.0  # share of responses answered with HTTP 500
+    truncate_rate: float = 0.0  # share of responses cut in the middle
+    slow_rate: float = 0.0  # share of responses trickled out slowly
+    slow_duration: float = 5.0  # seconds a slow response takes
+
+
+def initial_state(pumps: int = 1) -> dict[str, Any]:
+    """Return the payload of a freshly started controller."""
+    payload = {
+        "state": {
+            "cards": {
+                "pumps": [
+                    {
+                        "state": 1,
+                        "rpm": 2400,
+                        "power": 450,
+                        "powerTotal": 1_250_000,
+                        "slabClose": False,
+                        "waterPresent": True,
+                    }
+                ],
+                "electrolyzer": {"state": 1},
+            },
+            "spotlight": {"state": 0, "mode": 0},
+            "roller": {"state": 0, "mode": 0, "position": 100},
+            "remote": {"number": 1, "state": 0},
+            "filtration": {
+                "mode": 1,
+                "actualProg": 2,
+                "state": 1,
+                "swimming": {"remainTime": 0},
+                "pause": {"remainTime": 0},
+            },
+            "metrics": {
+                "waterTemperature": 26.5,
+                "airTemperature": 22.0,
+                "ph": 7.2,
+                "phAlarmLimits": [6.8, 7.6],
+                "orp": 720,
+                "orpAlarmLimits": [650, 800],
+                "freeChlorine": 1.2,
+                "salinity": 4.1,
+                "salinityAlarmLimits": [3.0],
+                "waterHardness": 15,
+                "filterClogging": 12,
+            },
+        }
+    }
+    cards = payload["state"]["cards"]
+    cards["pumps"] += [copy.deepcopy(cards["pumps"][0]) for _ in range(pumps - 1)]
+    return payload
+
+
+def _walk(value: float, step: float, low: float, high: float, digits: int) -> float:
+    """Return a bounded random walk step of a value."""
+    return round(min(high, max(low, value + random.uniform(-step, step))), digits)
+
+
+class PoolSimulator:
+    """Simulated pool controller state."""
+
+    def __init__(self, drift_interval: float, pumps: int = 1) -> None:
+        """Initialize the simulator."""
+        self.payload = initial_state(pumps)
+        self.faults = Faults()
+        self.requests = 0
+        self.commands = 0
+        self.drift_interval = drift_interval
+        self._last_drift = time.monotonic()
+        self._energy = [
+            float(pump["powerTotal"]) for pump in self.payload["state"]["cards"]["pumps"]
+        ]
+
+    def drift(self) -> None:
+        """Advance the simulated pool by the time elapsed since last drift."""
+        now = time.monotonic()
+        steps = int((now - self._last_drift) / self.drift_interval)
+        if steps <= 0:
+            return
+        self._last_drift += steps * self.drift_interval
+
+        for _ in range(min(steps, 100)):
+            self._step()
+
+    def _step(self) -> None:
+        """Advance the simulated pool by one drift interval."""
+        state = self.payload["state"]
+        metrics = state["metrics"]
+        roller = state["roller"]
+        filtration = state["filtration"]
+
+        for index, pump in enumerate(state["cards"]["pumps"]):
+            if pump["state"]:
+                pump["rpm"] = int(_walk(pump["rpm"], 50, 1200, 3000, 0))
+                pump["power"] = int(pump["rpm"] * 0.19)
+                self._energy[index] += pump["power"] * self.drift_interval / 3600
+                pump["powerTotal"] = int(self._energy[index])
+            else:
+                pump["rpm"] = 0
+                pump["power"] = 0
+
+        metrics["waterTemperature"] = _walk(metrics["waterTemperature"], 0.05, 10, 35, 1)
+        metrics["airTemperature"] = _walk(metrics["airTemperature"], 0.1, -5, 40, 1)
+        metrics["ph"] = _walk(metrics["ph"], 0.01, 6.5, 8.0, 2)
+        metrics["orp"] = int(_walk(metrics["orp"], 3, 550, 900, 0))
+        metrics["freeChlorine"] = _walk(metrics["freeChlorine"], 0.02, 0, 3, 2)
+        metrics["salinity"] = _walk(metrics["salinity"], 0.01, 2.5, 6, 2)
+
+        # Moving cover: state 1 opens, state 2 closes
+        if roller["state"] == 1:
+            roller["position"] = min(100, roller["position"] + 2)
+            if roller["position"] == 100:
+                roller["state"] = 0
+        elif roller["state"] == 2:
+            roller["position"] = max(0, roller["position"] - 2)
+            if roller["position"] == 0:
+                roller["state"] = 0
+        elif random.random() < 0.002:
+            roller["state"] = 2 if roller["position"] else 1
+
+        for timer in (filtration["swimming"], filtration["pause"]):
+            if timer["remainTime"] > 0 and random.random() < self.drift_interval / 60:
+                timer["remainTime"] -= 1
+
+    async def handle_info(self, request: web.Request) -> web.StreamResponse:
+        """Serve the pool info payload, injecting the configured faults."""
+        self.requests += 1
+        self.drift()
+        faults = self.faults
+
+        if faults.latency:
+            await asyncio.sleep(faults.latency)
+        if random.random() < faults.error_rate:
+            return web.Response(status=500, text="Internal error")
+
+        body = json.dumps(self.payload).encode()
+
+        if random.random() < faults.truncate_rate:
+            body = body[: len(body) // 2]
+
+        if random.random() < faults.slow_rate:
+            response = web.StreamResponse(
+                headers={"Content-Type": "application/json"}
+            )
+            await response.prepare(request)
+            chunks = [body[i : i + 64] for i in range(0, len(body), 64)]
+            for chunk in chunks:
+                await response.write(chunk)
+                await asyncio.sleep(faults.slow_duration / len(chunks))
+            await response.write_eof()
+            return response
+
+        return web.Response(body=body, content_type="application/json")
+
+    async def handle_command(self, request: web.Request) -> web.Response:
+        """Apply the values of a command to the simulated state."""
+        self.commands += 1
+        try:
+            for command in (await request.json())["set"]:
+                *parents, last = command["path"]
+                target = self.payload
+                for key in parents:
+                    target = target[key]
+                target[last] = command["value"]
+        except (ValueError, KeyError, IndexError, TypeError) as err:
+            return web.json_response({"error": str(err)}, status=400)
+        return web.json_response({"applied": True})
+
+    async def handle_get_faults(self, request: web.Request) -> web.Response:
+        """Return the injected faults."""
+        return web.json_response(
+            {**asdict(self.faults), "requests": self.requests, "commands": self.commands}
+        )
+
+    async def handle_set_faults(self, request: web.Request) -> web.Response:
+        """Update the injected faults."""
+        self.faults = Faults(**{**asdict(self.faults), **await request.json()})
+        return web.json_response(asdict(self.faults))
+
+    async def handle_set_state(self, request: web.Request) -> web.Response:
+        """Merge a partial payload into the simulated state."""
+        _merge(self.payload, await request.json())
+        return web.json_response(self.payload)
+
+
+async def push_changes(simulator: PoolSimulator, url: str) -> None:
+    """Post the payload to a webhook every time it changes."""
+    last_body = None
+    async with ClientSession() as session:
+        while True:
+            simulator.drift()
+            body = json.dumps(simulator.payload).encode()
+            if body != last_body:
+                try:
+                    async with session.post(
+                        url, data=body, headers={"Content-Type": "application/json"}
+                    ) as response:
+                        if response.status >= 400:
+                            print(f"Push to {url} answered HTTP {response.status}")
+                except ClientError as err:
+                    print(f"Push to {url} failed: {err}")
+                else:
+                    last_body = body
+            await asyncio.sleep(simulator.drift_interval)
+
+
+def _merge(target: dict[str, Any], patch: dict[str, Any]) -> None:
+    """Deep merge a patch into a payload."""
+    for key, value in patch.items():
+        if isinstance(value, dict) and isinstance(target.get(key), dict):
+            _merge(target[key], value)
+        else:
+            target[key] = copy.deepcopy(value)
+
+
+def create_app(
+    simulator: PoolSimulator,
+    path: str = DEFAULT_PATH,
+    command_path: str = DEFAULT_COMMAND_PATH,
+) -> web.Application:
+    """Create the web application serving a simulated controller."""
+    app = web.Application()
+    app.router.add_get(path, simulator.handle_info)
+    app.router.add_post(command_path, simulator.handle_command)
+    app.router.add_get("/simulator/faults", simulator.handle_get_faults)
+    app.router.add_post("/simulator/faults", simulator.handle_set_faults)
+    app.router.add_post("/simulator/state", simulator.handle_set_state)
+    return app
+
+
+async def async_main(args: argparse.Namespace) -> None:
+    """Serve the simulated controllers until interrupted."""
+    runners = []
+    push_tasks = []
+    push_urls = args.push_url or []
+    for index in range(args.count):
+        simulator = PoolSimulator(args.drift_interval, args.pumps)
+        simulator.faults = Faults(
+            latency=args.latency,
+            error_rate=args.error_rate,
+            truncate_rate=args.truncate_rate,
+            slow_rate=args.slow_rate,
+        )
+        runner = web.AppRunner(create_app(simulator, args.path, args.command_path))
+        await runner.setup()
+        await web.TCPSite(runner, args.host, args.port + index).start()
+        runners.append(runner)
+        print(f"Simulated controller on http://{args.host}:{args.port + index}{args.path}")
+        if index < len(push_urls):
+            push_tasks.append(
+                asyncio.create_task(push_changes(simulator, push_urls[index]))
+            )
+
+    try:
+        await asyncio.Event().wait()
+    finally:
+        for task in push_tasks:
+            task.cancel()
+        for runner in runners:
+            await runner.cleanup()
+
+
+def main() -> None:
+    """Parse the command line and run the simulator."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=11000)
+    parser.add_argument("--path", default=DEFAULT_PATH)
+    parser.add_argument("--command-path", default=DEFAULT_COMMAND_PATH)
+    parser.add_argument(
+        "--count", type=int, default=1, help="controllers on successive ports"
+    )
+    parser.add_argument("--pumps", type=int, default=1)
+    parser.add_argument("--drift-interval", type=float, default=1.0)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--truncate-rate", type=float, default=0.0)
+    parser.add_argument("--slow-rate", type=float, default=0.0)
+    parser.add_argument(
+        "--push-url",
+        action="append",
+        help="webhook URL to push changes to, once per controller",
+    )
+
+    try:
+        asyncio.run(async_main(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+"""Tests of the normalization of the pool payloads."""
+from __future__ import annotations
+
+import pytest
+
+from custom_components.magiline_imagix.const import SENSOR_DEFINITIONS
+from custom_components.magiline_imagix.normalize import CompiledSchema, CorruptPayload
+from custom_components.magiline_imagix.paths import compile_sensor_paths
+
+PATHS = compile_sensor_paths(SENSOR_DEFINITIONS)
+
+
+@pytest.mark.parametrize(
+    "data",
+    [{}, {"status": "ok", "firmware": {"version": "1.2.3"}}],
+    ids=["empty", "unrelated"],
+)
+def test_payload_without_sensor_values_is_corrupt(data: dict) -> None:
+    """A payload without any value of the schema is dropped."""
+    schema = CompiledSchema(SENSOR_DEFINITIONS)
+    with pytest.raises(CorruptPayload):
+        schema.normalize(PATHS.resolve(data))
+
+
+def test_payload_with_sensor_values_is_normalized() -> None:
+    """Values of a regular payload are coerced to the type of their sensor."""
+    schema = CompiledSchema(SENSOR_DEFINITIONS)
+    snapshot = PATHS.resolve({"state": {"metrics": {"waterTemperature": "26.5"}}})
+    assert schema.normalize(snapshot) == 0
+    assert snapshot["water_temperature"] == 26.5